@@ -3,15 +3,58 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QScrollArea, QGridLayout, QFrame
 )
-from PySide6.QtGui import QPixmap, QCursor, QBitmap, QPainter
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PySide6.QtGui import QPixmap, QCursor, QBitmap, QPainter, QImage, QImageReader
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QObject, QRunnable, \
+    QThreadPool, Signal, QSize, QBuffer, QByteArray, QIODevice
 from googleapiclient.discovery import build
 from config import YOUTUBE_API_KEY
 
+# Розмір круглого прев'ю на картці відео
+THUMB_SIZE = QSize(180, 180)
 
 
 
 
+
+class ThumbnailTaskSignals(QObject):
+    loaded = Signal(QImage)  # прев'ю, вже декодоване в розмірі картки
+    failed = Signal()
+
+
+class ThumbnailTask(QRunnable):
+    """Завантажує прев'ю відео у воркері QThreadPool, а не в GUI-потоці."""
+
+    def __init__(self, url, size):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.signals = ThumbnailTaskSignals()
+
+    def run(self):
+        try:
+            resp = requests.get(self.url, timeout=10)
+            resp.raise_for_status()
+        except Exception:
+            self.signals.failed.emit()
+            return
+
+        # Декодуємо тут же і одразу в потрібному розмірі: QImageReader масштабує
+        # під час декодування, а GUI-потоку лишається тільки накласти маску
+        buffer = QBuffer()
+        buffer.setData(QByteArray(resp.content))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(self.size, Qt.KeepAspectRatioByExpanding))
+        image = reader.read()
+        buffer.close()
+        if image.isNull():
+            self.signals.failed.emit()
+        else:
+            self.signals.loaded.emit(image)
+
+
 class VideoCard(QFrame):
     def __init__(self, title, thumbnail_url, video_url):
         super().__init__()
@@ -56,24 +99,11 @@ class VideoCard(QFrame):
         self.label_thumb = QLabel()
         self.label_thumb.setFixedSize(180,180)
         self.label_thumb.setAlignment(Qt.AlignCenter)
-        try:
-            resp = requests.get(thumbnail_url)
-            pixmap = QPixmap()
-            pixmap.loadFromData(resp.content)
-            pixmap = pixmap.scaled(180,180, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-
-            # Маска для кола
-            mask = QBitmap(pixmap.size())
-            mask.fill(Qt.color0)
-            painter = QPainter(mask)
-            painter.setBrush(Qt.color1)
-            painter.drawEllipse(0,0,pixmap.width(),pixmap.height())
-            painter.end()
-            pixmap.setMask(mask)
-
-            self.label_thumb.setPixmap(pixmap)
-        except:
-            self.label_thumb.setText("No preview")
+        # Прев'ю вантажиться у пулі потоків, картка з'являється одразу
+        task = ThumbnailTask(thumbnail_url, THUMB_SIZE)
+        task.signals.loaded.connect(self.on_thumbnail_loaded, Qt.QueuedConnection)
+        task.signals.failed.connect(self.on_thumbnail_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(task)
         content_layout.addWidget(self.label_thumb, alignment=Qt.AlignCenter)
 
         # Назва відео з градієнтним текстом
@@ -106,19 +136,42 @@ class VideoCard(QFrame):
         self.leaveEvent = self.on_hover_leave
         self.mousePressEvent = self.open_video
 
+    def on_thumbnail_loaded(self, image):
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.width() != THUMB_SIZE.width() and pixmap.height() != THUMB_SIZE.height():
+            # Формат не повідомив розмір заздалегідь — масштабуємо вже декодоване
+            pixmap = pixmap.scaled(THUMB_SIZE, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+        # Маска для кола
+        mask = QBitmap(pixmap.size())
+        mask.fill(Qt.color0)
+        painter = QPainter(mask)
+        painter.setBrush(Qt.color1)
+        painter.drawEllipse(0,0,pixmap.width(),pixmap.height())
+        painter.end()
+        pixmap.setMask(mask)
+
+        self.label_thumb.setPixmap(pixmap)
+
+    def on_thumbnail_failed(self):
+        self.label_thumb.setText("No preview")
+
     def on_hover_enter(self, event):
-        rect = self.geometry()
-        self.anim.stop()
-        self.anim.setStartValue(rect)
-        self.anim.setEndValue(rect.adjusted(-5,-5,5,5))
-        self.anim.start()
+        # Одна анімація: вхід грає її вперед, вихід — назад з поточного кадру
+        if self.anim.state() != QAbstractAnimation.Running:
+            rect = self.geometry()
+            self.anim.setStartValue(rect)
+            self.anim.setEndValue(rect.adjusted(-5,-5,5,5))
+        self._run_hover_anim(QAbstractAnimation.Forward)
 
     def on_hover_leave(self, event):
-        rect = self.geometry()
-        self.anim.stop()
-        self.anim.setStartValue(rect)
-        self.anim.setEndValue(rect.adjusted(5,5,-5,-5))
-        self.anim.start()
+        if self.anim.endValue() is not None:
+            self._run_hover_anim(QAbstractAnimation.Backward)
+
+    def _run_hover_anim(self, direction):
+        self.anim.setDirection(direction)
+        if self.anim.state() != QAbstractAnimation.Running:
+            self.anim.start()
 
     def open_video(self, event):
         webbrowser.open(self.video_url)
@@ -8,12 +8,12 @@ Author: Generated Code Assistant
 """
 
 import cv2
+import hashlib
 import numpy as np
-from sklearn.cluster import KMeans
-from collections import Counter
 from scipy.stats import mode
 import colorsys
 import math
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional, Union, Any
 import logging
 
@@ -40,6 +40,9 @@ DEFAULT_PALETTE: List[RGBColor] = [
 IMAGE_SIZE = (200, 200)
 KMEANS_CLUSTERS = 12
 KMEANS_INIT = 5
+KMEANS_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
+QUANTIZE_SHIFT = 3  # 8 -> 5 bits per channel for the colour histogram
+HISTOGRAM_BINS = 1 << (3 * (8 - QUANTIZE_SHIFT))
 MIN_SATURATION = 0.15
 MIN_LIGHTNESS = 0.1
 MAX_COLOR_VARIATIONS = 6
@@ -48,6 +51,9 @@ BACKGROUND_ADJUSTMENT = 20
 
 # Global cache for extracted colors
 color_cache: Dict[str, List[RGBColor]] = {}
+# Same results keyed by a hash of the image bytes: every track of an album has
+# its own copy of the cover file, and they all share one extraction
+content_color_cache: Dict[str, List[RGBColor]] = {}
 
 
 class ColorExtractionError(Exception):
@@ -126,10 +132,14 @@ def hsl_to_rgb(hsl: HSLColor) -> RGBColor:
     return (int(r * 255), int(g * 255), int(b * 255))
 
 
+@lru_cache(maxsize=1024)
 def calculate_luminance(r: int, g: int, b: int) -> float:
     """
     Calculate relative luminance for contrast ratio.
 
+    Memoised: theme generation checks the same few palette colours against
+    white and black many times, and each call costs three pow() evaluations.
+
     Args:
         r, g, b: RGB components (0-255)
 
@@ -223,12 +233,13 @@ def validate_image_path(image_path: str) -> None:
     # The actual file check will happen during image loading
 
 
-def load_and_preprocess_image(image_path: str) -> np.ndarray:
+def load_and_preprocess_image(image_path: str, data: Optional[bytes] = None) -> np.ndarray:
     """
     Load and preprocess image for color extraction.
 
     Args:
         image_path: Path to image file
+        data: Already read file contents (decoded instead of reading the file again)
 
     Returns:
         Preprocessed image array
@@ -237,17 +248,20 @@ def load_and_preprocess_image(image_path: str) -> np.ndarray:
         ColorExtractionError: If image cannot be loaded
     """
     try:
-        image = cv2.imread(image_path)
+        # Palette extraction only needs a 200x200 sample: let the decoder skip
+        # half the resolution (JPEG decodes at 1/2 scale without a full IDCT)
+        if data is None:
+            image = cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_2)
+        else:
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_REDUCED_COLOR_2)
         if image is None:
             raise ColorExtractionError(f"Could not load image: {image_path}")
 
-        # Convert BGR to RGB
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-        # Resize for performance
+        # Resize first so the BGR -> RGB conversion only touches the small image
         image = cv2.resize(image, IMAGE_SIZE)
 
-        return image
+        # Convert BGR to RGB
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     except Exception as e:
         raise ColorExtractionError(f"Failed to load image {image_path}: {e}")
 
@@ -263,13 +277,35 @@ def extract_color_candidates(pixels: np.ndarray) -> List[Tuple[RGBColor, float]]
         List of (color, vibrancy_score) tuples
     """
     try:
-        # Use KMeans to find dominant colors
-        kmeans = KMeans(n_clusters=KMEANS_CLUSTERS, n_init=KMEANS_INIT, random_state=42)
-        labels = kmeans.fit_predict(pixels)
-        centers = np.array(kmeans.cluster_centers_, dtype=np.uint8)
-
-        # Get RGB colors
-        candidate_colors = [tuple(int(c) for c in center) for center in centers]
+        # Bucket pixels into a 5-bit-per-channel histogram; flat covers (and the
+        # generated default artwork) have no more buckets than clusters, and their
+        # bucket means are the answer without running KMeans at all
+        quantized = (pixels >> QUANTIZE_SHIFT).astype(np.intp)
+        keys = (quantized[:, 0] << 10) | (quantized[:, 1] << 5) | quantized[:, 2]
+        # Keys are packed into 15 bits, so a dense bincount is a single O(N) pass
+        # (np.unique would sort every pixel)
+        key_counts = np.bincount(keys, minlength=HISTOGRAM_BINS)
+        buckets = np.flatnonzero(key_counts)
+
+        if len(buckets) <= KMEANS_CLUSTERS:
+            remap = np.zeros(HISTOGRAM_BINS, dtype=np.intp)
+            remap[buckets] = np.arange(len(buckets))
+            labels = remap[keys]
+            sizes = key_counts[buckets]
+            centers = np.stack([np.bincount(labels, weights=pixels[:, c]) for c in range(3)], axis=1)
+            centers = (centers / sizes[:, None]).astype(np.uint8)
+        else:
+            # Use OpenCV's KMeans (k-means++ seeding, fixed seed for repeatable palettes)
+            cv2.setRNGSeed(42)
+            _, labels, centers = cv2.kmeans(pixels.astype(np.float32), KMEANS_CLUSTERS, None,
+                                            KMEANS_CRITERIA, KMEANS_INIT, cv2.KMEANS_PP_CENTERS)
+            labels = labels.ravel()
+            centers = np.clip(centers, 0, 255).astype(np.uint8)
+
+        # Get RGB colors, most populated clusters first; empty clusters are dropped
+        counts = np.bincount(labels, minlength=len(centers))
+        order = np.argsort(-counts, kind='stable')
+        candidate_colors = [tuple(int(c) for c in centers[i]) for i in order if counts[i]]
 
         # Calculate vibrancy scores and filter
         filtered_colors = []
@@ -336,20 +372,30 @@ def extract_dominant_colors(image_path: str, num_colors: int = 6) -> List[RGBCol
         # Validate input
         validate_image_path(image_path)
 
-        # Load and preprocess image
-        image = load_and_preprocess_image(image_path)
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            raise ColorExtractionError(f"Could not read image {image_path}: {e}")
+
+        content_key = f"{hashlib.blake2b(data, digest_size=8).hexdigest()}:{num_colors}"
+        colors = content_color_cache.get(content_key)
+        if colors is None:
+            # Load and preprocess image
+            image = load_and_preprocess_image(image_path, data)
 
-        # Reshape pixels
-        pixels = image.reshape(-1, 3)
+            # Reshape pixels
+            pixels = image.reshape(-1, 3)
 
-        # Extract candidate colors
-        candidate_colors = extract_color_candidates(pixels)
+            # Extract candidate colors
+            candidate_colors = extract_color_candidates(pixels)
 
-        # Take top colors
-        colors = [color for color, score in candidate_colors[:num_colors]]
+            # Take top colors
+            colors = [color for color, score in candidate_colors[:num_colors]]
 
-        # Pad with defaults if needed
-        colors = pad_color_palette(colors, num_colors)
+            # Pad with defaults if needed
+            colors = pad_color_palette(colors, num_colors)
+            content_color_cache[content_key] = colors
 
         # Cache the result
         color_cache[image_path] = colors
@@ -775,6 +821,7 @@ def generate_theme_from_cover(cover_path: str) -> ThemeResult:
 def clear_color_cache() -> None:
     """Clear the color extraction cache."""
     color_cache.clear()
+    content_color_cache.clear()
     logger.info("Color cache cleared")
 
 
@@ -1,6 +1,9 @@
-from PySide6.QtCore import QObject, Signal, QUrl
+from PySide6.QtCore import QObject, Signal, QUrl, Qt
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
+# Smaller position steps are not forwarded to the UI
+POSITION_NOTIFY_STEP_MS = 100
+
 
 class AudioEngineQt(QObject):
     """Fallback audio engine_sound that wraps QMediaPlayer to provide same signals."""
@@ -11,34 +14,53 @@ class AudioEngineQt(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # The multimedia backend and audio device are opened on first use
+        self.player = None
+        self.audio_output = None
+        self._last_notified_pos = -1
+
+    def _ensure_player(self):
+        if self.player is not None:
+            return
         self.player = QMediaPlayer()
         self.audio_output = QAudioOutput()
         self.player.setAudioOutput(self.audio_output)
-        self.player.positionChanged.connect(self._on_position)
-        self.player.durationChanged.connect(self._on_duration)
-        self.player.mediaStatusChanged.connect(self._on_media_status)
-        self.player.playbackStateChanged.connect(self._on_playback_state)
+        # The player lives in this object's thread, so its signals are delivered
+        # directly instead of letting AutoConnection decide on every emit
+        for signal, slot in ((self.player.positionChanged, self._on_position),
+                             (self.player.durationChanged, self._on_duration),
+                             (self.player.mediaStatusChanged, self._on_media_status),
+                             (self.player.playbackStateChanged, self._on_playback_state)):
+            signal.connect(slot, Qt.DirectConnection)
 
     def set_source(self, file_path):
         try:
+            self._ensure_player()
             url = QUrl.fromLocalFile(file_path)
+            self._last_notified_pos = -1
             self.player.setSource(url)
         except Exception as e:
             print("QtAudio set_source error:", e)
 
     def play(self):
+        if self.player is None:
+            return
         try:
             self.player.play()
         except Exception as e:
             print("QtAudio play error:", e)
 
     def pause(self):
+        if self.player is None:
+            return
         try:
             self.player.pause()
         except Exception as e:
             print("QtAudio pause error:", e)
 
     def stop(self):
+        if self.player is None:
+            return
         try:
             self.player.stop()
         except Exception as e:
@@ -63,7 +85,11 @@ class AudioEngineQt(QObject):
             return 0
 
     def _on_position(self, pos):
-        self.position_changed.emit(int(pos))
+        pos = int(pos)
+        if abs(pos - self._last_notified_pos) < POSITION_NOTIFY_STEP_MS:
+            return
+        self._last_notified_pos = pos
+        self.position_changed.emit(pos)
 
     def _on_duration(self, dur):
         self.duration_changed.emit(int(dur))
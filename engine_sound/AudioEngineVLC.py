@@ -6,6 +6,10 @@ try:
 except Exception:
     _HAVE_VLC = False
 
+# VLC reports time from its own thread many times per second; every emit is a
+# queued event for the GUI thread, so smaller steps are not forwarded
+POSITION_NOTIFY_STEP_MS = 100
+
 class AudioEngineVLC(QObject):
     """Audio engine_sound using python-vlc with Qt-friendly signals."""
     position_changed = Signal(int)
@@ -21,6 +25,7 @@ class AudioEngineVLC(QObject):
         self._media = None
         self._duration = 0
         self._position = 0
+        self._last_notified_pos = -1
 
         self._em = self.player.event_manager()
         self._em.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_time_changed)
@@ -34,7 +39,11 @@ class AudioEngineVLC(QObject):
         try:
             t = self.player.get_time()
             if t is None: t = 0
-            self.position_changed.emit(max(0, int(t)))
+            t = max(0, int(t))
+            if abs(t - self._last_notified_pos) < POSITION_NOTIFY_STEP_MS:
+                return
+            self._last_notified_pos = t
+            self.position_changed.emit(t)
         except Exception:
             pass
 
@@ -68,6 +77,7 @@ class AudioEngineVLC(QObject):
                 pass
             self.player.set_media(media)
             self._media = media
+            self._last_notified_pos = -1
             
             # Emit duration changed signal if duration is available
             duration = media.get_duration()
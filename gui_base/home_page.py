@@ -2,17 +2,481 @@ import os
 import hashlib
 import io
 import tempfile
+import threading
 from pathlib import Path
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QFrame, QGraphicsDropShadowEffect, QGridLayout, QScrollArea, \
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QGraphicsDropShadowEffect, QListView, \
+    QAbstractItemView, QStyledItemDelegate, QStyle, QGraphicsScene, QGraphicsPixmapItem, \
     QPushButton, QHBoxLayout, QMenu, QMessageBox, QInputDialog
-from PySide6.QtCore import Qt, QSize, Signal, QPoint
-from PySide6.QtGui import QPainter, QColor, QBrush, QFont, QPixmap, QLinearGradient, QIcon, QPainterPath
+from PySide6.QtCore import Qt, QSize, Signal, QPoint, QBuffer, QByteArray, QIODevice, QAbstractListModel, QModelIndex, \
+    QRectF, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QPainter, QColor, QBrush, QFont, QPixmap, QLinearGradient, QIcon, QPixmapCache, \
+    QImageReader, QFontMetrics, QImage
+
+# Для читання вбудованих обкладинок з аудіофайлів. mutagen підтягує всі свої
+# модулі форматів, тому імпортується лише при першому зверненні (див. _mutagen_file)
+_MUTAGEN_FILE = None
+
+from id3_reader import read_id3_tags
+
+# Ліміт QPixmapCache у KiB — обкладинки кешуються вже масштабованими до розміру відображення
+COVER_CACHE_LIMIT_KB = 128 * 1024
+
+# Кольори підписів карток (назва, виконавець) для кожної теми
+CARD_LABEL_COLORS = {
+    "dark": ("white", "#b3b3b3"),
+    "light": ("black", "#555555"),
+}
+
+# Декодовані вбудовані обкладинки за хешем вмісту: треки одного альбому
+# мають однакову картинку, тож вона декодується один раз на альбом
+_ART_IMAGES = {}
+_ART_IMAGES_LIMIT = 64
+# Кеші модуля читаються й пишуться з потоків CoverTask; замок тримається лише
+# на час звернення до словника, декодування йде без нього
+_CACHE_LOCK = threading.Lock()
+
+
+def read_scaled_image(reader, size):
+    """Декодує зображення з ``reader`` одразу в розмірі ``size`` (з заповненням).
+
+    Масштабування виконує сам QImageReader під час декодування (для JPEG —
+    зменшеним декодуванням), тож повнорозмірна картинка в пам'ять не
+    потрапляє. Працює з QImage, тому придатна і для фонових потоків.
+    Повертає QImage або None.
+    """
+    source_size = reader.size()
+    if source_size.isValid():
+        target_size = source_size.scaled(size, Qt.KeepAspectRatioByExpanding)
+        # Обкладинки, збережені вже в потрібному розмірі, декодуються як є
+        if target_size != source_size:
+            reader.setScaledSize(target_size)
+    image = reader.read()
+    if image.isNull():
+        return None
+    if not source_size.isValid() and image.size().scaled(size, Qt.KeepAspectRatioByExpanding) != image.size():
+        # Формат не повідомляє розмір заздалегідь — масштабуємо вже декодоване.
+        # Великі картинки спершу швидко зменшуємо до подвійного розміру, щоб
+        # плавне масштабування працювало з малим зображенням
+        if image.width() > 2 * size.width() and image.height() > 2 * size.height():
+            image = image.scaled(size * 2, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation)
+        image = image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    return image
+
+
+def read_scaled_pixmap(reader, size):
+    """Те саме, що read_scaled_image, але повертає QPixmap (лише GUI-потік)"""
+    image = read_scaled_image(reader, size)
+    return None if image is None else QPixmap.fromImage(image)
+
+
+def cached_cover_pixmap(cover_path, size):
+    """Повертає обкладинку з файлу, масштабовану до ``size``, або None.
+
+    Результат зберігається в QPixmapCache, а пам'ять обмежена лімітом кешу.
+    """
+    key = f"cover:{cover_path}:{size.width()}x{size.height()}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    if not os.path.exists(cover_path):
+        return None
+    pixmap = read_scaled_pixmap(QImageReader(cover_path), size)
+    if pixmap is not None:
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _mutagen_file():
+    """mutagen.File, або False, якщо mutagen недоступний"""
+    global _MUTAGEN_FILE
+    if _MUTAGEN_FILE is None:
+        try:
+            from mutagen import File as MutagenFile
+        except Exception:
+            MutagenFile = False
+        _MUTAGEN_FILE = MutagenFile
+    return _MUTAGEN_FILE
+
+
+def read_embedded_picture(audio_path):
+    """Повертає байти вбудованої обкладинки аудіофайлу або None"""
+    # MP3: читається лише блок ID3-тега, без повного розбору файлу mutagen'ом
+    if audio_path.lower().endswith('.mp3'):
+        try:
+            tags = read_id3_tags(audio_path)
+        except Exception:
+            tags = None
+        if tags is not None:
+            apic = tags.get('APIC')
+            return apic['data'] if apic else None
+
+    MutagenFile = _mutagen_file()
+    if not MutagenFile:
+        return None
+    af = MutagenFile(audio_path)
+    if af is None:
+        return None
+    # mp3 (APIC), or ID3; для mp4/m4a/ogg різні теги
+    pic_data = None
+    if hasattr(af, 'tags') and af.tags is not None:
+        tags = af.tags
+        # APIC frame (mp3)
+        if hasattr(tags, 'getall'):
+            for pic in tags.getall('APIC'):
+                if getattr(pic, 'data', None):
+                    pic_data = pic.data
+                    break
+        # For MP4/M4A
+        if pic_data is None and hasattr(af, 'pictures') and af.pictures:
+            pic_data = af.pictures[0].data
+        # For ID3v2 common access
+        if pic_data is None:
+            try:
+                # some containers keep 'covr' or 'metadata_block_picture'
+                if 'covr' in tags:
+                    covr = tags.get('covr')
+                    if covr:
+                        pic_data = covr[0]
+            except Exception:
+                pass
+    return pic_data
+
+
+def load_song_cover(song, size):
+    """Читає й декодує обкладинку пісні в розмірі ``size``; QImage або None.
+
+    Послідовність спроб:
+     1) Якщо song['cover_path'] існує на диску — завантажити його.
+     2) Спробувати витягти вбудований артефакт з аудіофайлу.
+    Не торкається QPixmap і QPixmapCache, тож викликається з CoverTask.
+    """
+    # 1) файл обкладинки явно вказаний
+    cover_path = song.get('cover_path')
+    if cover_path and os.path.exists(cover_path):
+        image = read_scaled_image(QImageReader(cover_path), size)
+        if image is not None:
+            return image
+
+    # 2) Спробувати витягти вбудовану обкладинку з аудіо
+    audio_path = song.get('file_path') or song.get('path') or song.get('filepath')
+    if not audio_path or not os.path.exists(audio_path):
+        return None
+    try:
+        pic_data = read_embedded_picture(audio_path)
+        if not pic_data:
+            return None
+        pic_data = bytes(pic_data)
+        art_key = (hashlib.blake2b(pic_data, digest_size=8).hexdigest(), size.width(), size.height())
+        with _CACHE_LOCK:
+            image = _ART_IMAGES.get(art_key)
+        if image is None:
+            # Декодуємо одразу в потрібному розмірі
+            buffer = QBuffer()
+            buffer.setData(QByteArray(pic_data))
+            buffer.open(QIODevice.ReadOnly)
+            image = read_scaled_image(QImageReader(buffer), size)
+            buffer.close()
+            if image is not None:
+                with _CACHE_LOCK:
+                    if len(_ART_IMAGES) >= _ART_IMAGES_LIMIT:
+                        _ART_IMAGES.clear()
+                    _ART_IMAGES[art_key] = image
+        return image
+    except Exception:
+        # мовчазно пропускаємо помилки читання метаданих
+        return None
+
+
+# Маски заокруглення за ключем (width, height, radius)
+_ROUNDED_MASKS = {}
+
+
+def _rounded_mask(size, radius):
+    key = (size.width(), size.height(), radius)
+    with _CACHE_LOCK:
+        mask = _ROUNDED_MASKS.get(key)
+    if mask is None:
+        mask = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        mask.fill(Qt.transparent)
+        painter = QPainter(mask)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.black)
+        painter.drawRoundedRect(0, 0, size.width(), size.height(), radius, radius)
+        painter.end()
+        # Розмірів обкладинок небагато; якщо їх стало забагато — починаємо спочатку
+        with _CACHE_LOCK:
+            if len(_ROUNDED_MASKS) >= 16:
+                _ROUNDED_MASKS.clear()
+            _ROUNDED_MASKS[key] = mask
+    return mask
 
-# Для читання вбудованих обкладинок з аудіофайлів
-try:
-    from mutagen import File as MutagenFile
-except Exception:
-    MutagenFile = None
+
+def rounded_image(image, radius):
+    size = image.size()
+    rounded = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    rounded.fill(Qt.transparent)
+
+    # Замість згладженого setClipPath — множення на готову альфа-маску
+    painter = QPainter(rounded)
+    painter.drawImage(0, 0, image)
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, _rounded_mask(size, radius))
+    painter.end()
+
+    return rounded
+
+
+class CoverTaskSignals(QObject):
+    loaded = Signal(str, str, QImage)  # cache key, title, rounded cover (null if the song has none)
+
+
+class CoverTask(QRunnable):
+    """Читає, декодує й заокруглює обкладинку картки в потоці QThreadPool"""
+
+    def __init__(self, key, song, size):
+        super().__init__()
+        self.key = key
+        self.song = song
+        self.title = song.get('title') or 'Unknown'
+        self.size = size
+        self.signals = CoverTaskSignals()
+
+    def run(self):
+        image = load_song_cover(self.song, self.size)
+        if image is None:
+            self.signals.loaded.emit(self.key, self.title, QImage())
+            return
+        if image.size() != self.size:
+            # Масштабування із заповненням лишає зайве з одного боку — обрізаємо по центру
+            image = image.copy((image.width() - self.size.width()) // 2,
+                               (image.height() - self.size.height()) // 2,
+                               self.size.width(), self.size.height())
+        self.signals.loaded.emit(self.key, self.title, rounded_image(image, 10))
+
+
+class SongListModel(QAbstractListModel):
+    """Треки поточного плейлиста; картки малює SongCardDelegate"""
+
+    TrackRole = Qt.UserRole + 1
+
+    # Поля треку, які видно на картці
+    CARD_FIELDS = ('title', 'artist', 'cover_path')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tracks = []
+        self._card_values = []
+
+    def set_tracks(self, tracks):
+        """Оновлює треки; повертає True, якщо список довелося перебудувати.
+
+        Якщо набір і порядок треків не змінились (наприклад, змінився лише
+        лічильник відтворень), модель не скидається — вигляд зберігає
+        прокрутку, а перемальовуються тільки картки зі зміненими полями.
+        """
+        tracks = list(tracks)
+        card_values = [tuple(track.get(field) for field in self.CARD_FIELDS) for track in tracks]
+        same_rows = (len(tracks) == len(self._tracks) and
+                     all(new['id'] == old['id'] for new, old in zip(tracks, self._tracks)))
+        if not same_rows:
+            self.beginResetModel()
+            self._tracks = tracks
+            self._card_values = card_values
+            self.endResetModel()
+            return True
+
+        changed = [row for row, (new, old) in enumerate(zip(card_values, self._card_values)) if new != old]
+        self._tracks = tracks
+        self._card_values = card_values
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+        return False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tracks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        track = self._tracks[index.row()]
+        if role == Qt.DisplayRole:
+            return track.get('title', 'Unknown')
+        if role == self.TrackRole:
+            return track
+        return None
+
+
+class SongCardDelegate(QStyledItemDelegate):
+    """Малює картку пісні: тінь, фон, обкладинку, назву та виконавця.
+
+    Замість окремого QFrame з QLabel'ами і QGraphicsDropShadowEffect на кожен
+    трек view малює лише видимі картки, а фон з тінню растеризується один раз.
+    """
+
+    CARD_SIZE = QSize(220, 270)  # найменший розмір картки; висоту добирає __init__ під шрифти
+    COVER_SIZE = QSize(200, 200)
+    SPACING = 35
+    SHADOW_MARGIN = SPACING // 2
+    TEXT_CACHE_LIMIT = 1024
+
+    cover_loaded = Signal()  # обкладинка з фонового потоку готова, варто перемалювати view
+
+    def __init__(self, placeholder_provider, parent=None):
+        super().__init__(parent)
+        # placeholder_provider(title, size) -> QPixmap, поки обкладинка вантажиться
+        self._placeholder_provider = placeholder_provider
+        # Ключі обкладинок, що зараз завантажуються
+        self._pending = set()
+        # Власний пул на всю сесію: чергу обкладинок можна скинути, не чіпаючи
+        # інших задач глобального пулу (копіювання файлів, мініатюри)
+        self._cover_pool = QThreadPool(self)
+        # Ті самі шрифти, що були в QLabel'ах картки
+        self.title_font = QFont("Arial", 24, QFont.Bold)
+        self.artist_font = QFont("Arial", 16)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.artist_metrics = QFontMetrics(self.artist_font)
+        # Висота підписів — за шрифтом плюс відступи з колишнього стилю підписів
+        # (8px і 6px згори та знизу); картка росте, щоб підписи не обрізались
+        self._title_height = self.title_metrics.height() + 16
+        self._artist_height = self.artist_metrics.height() + 12
+        card_height = 10 + self.COVER_SIZE.height() + 8 + self._title_height + 4 + self._artist_height + 10
+        self.card_size = QSize(self.CARD_SIZE.width(), max(self.CARD_SIZE.height(), card_height))
+        self.set_theme("dark")
+        # Фони карток з тінню за ключем (dpr, hovered)
+        self._backgrounds = {}
+        # Обрізані підписи за ключем (text, is_title)
+        self._texts = {}
+
+    def set_theme(self, theme):
+        title_color, text_color = CARD_LABEL_COLORS[theme]
+        self._title_color = QColor(title_color)
+        self._text_color = QColor(text_color)
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_size.width() + self.SPACING, self.card_size.height() + self.SPACING)
+
+    def _background(self, dpr, hovered):
+        """Фон картки разом з тінню, растеризований один раз на стан"""
+        key = (dpr, hovered)
+        background = self._backgrounds.get(key)
+        if background is not None:
+            return background
+
+        card = QPixmap(self.card_size * dpr)
+        card.setDevicePixelRatio(dpr)
+        card.fill(Qt.transparent)
+        painter = QPainter(card)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(40, 40, 40, 217) if hovered else QColor(24, 24, 24, 179))
+        painter.drawRoundedRect(QRectF(0, 0, self.card_size.width(), self.card_size.height()), 20, 20)
+        painter.end()
+
+        # Та сама тінь, що й у QGraphicsDropShadowEffect картки, але відрендерена
+        # в pixmap, а не перераховувана при кожному перемальовуванні
+        margin = self.SHADOW_MARGIN
+        item = QGraphicsPixmapItem(card)
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(15)
+        shadow.setOffset(0, 5)
+        shadow.setColor(QColor(0, 0, 0, 120))
+        item.setGraphicsEffect(shadow)
+        scene = QGraphicsScene()
+        scene.addItem(item)
+
+        full = QSize(self.card_size.width() + 2 * margin, self.card_size.height() + 2 * margin)
+        background = QPixmap(full * dpr)
+        background.setDevicePixelRatio(dpr)
+        background.fill(Qt.transparent)
+        painter = QPainter(background)
+        scene.render(painter, QRectF(0, 0, full.width(), full.height()),
+                     QRectF(-margin, -margin, full.width(), full.height()))
+        painter.end()
+
+        self._backgrounds[key] = background
+        return background
+
+    def _cover(self, song):
+        # Заокруглена обкладинка, готова до малювання; ключ враховує cover_path,
+        # щоб нова обкладинка після пересканування не підмінялася старою
+        key = f"song_card:{song.get('id')}:{song.get('cover_path')}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+
+        # Читання тегів і декодування — у QThreadPool, GUI-потік лише малює
+        title = song.get('title', 'Unknown')
+        if key not in self._pending:
+            self._pending.add(key)
+            task = CoverTask(key, song, self.COVER_SIZE)
+            task.signals.loaded.connect(self._on_cover_loaded, Qt.QueuedConnection)
+            self._cover_pool.start(task)
+        return self._placeholder_provider(title, self.COVER_SIZE)
+
+    def shutdown(self):
+        self.drop_pending_covers()
+        self._cover_pool.waitForDone()
+
+    def drop_pending_covers(self):
+        """Скасовує обкладинки, що ще чекають у черзі (картки вже не показуються)"""
+        self._cover_pool.clear()
+        # Задачі, що вже виконуються, все одно повернуть результат; решту
+        # картки замовлять знову, коли з'являться на екрані
+        self._pending.clear()
+
+    def _on_cover_loaded(self, key, title, image):
+        # Назву несе сама задача: після drop_pending_covers ключа в _pending вже немає
+        self._pending.discard(key)
+        if image.isNull():
+            # Обкладинки немає — картка лишається з дефолтною, повторно не шукаємо
+            pixmap = self._placeholder_provider(title, self.COVER_SIZE)
+        else:
+            pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self.cover_loaded.emit()
+
+    def _elided(self, text, is_title, width):
+        key = (text, is_title)
+        elided = self._texts.get(key)
+        if elided is None:
+            if len(self._texts) >= self.TEXT_CACHE_LIMIT:
+                self._texts.clear()
+            metrics = self.title_metrics if is_title else self.artist_metrics
+            elided = self._texts[key] = metrics.elidedText(text, Qt.ElideRight, width)
+        return elided
+
+    def _draw_label(self, painter, rect, text, font, color, is_title):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(30, 30, 30, 180))
+        painter.drawRoundedRect(rect, rect.height() / 2, rect.height() / 2)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(rect, Qt.AlignCenter, self._elided(text, is_title, int(rect.width()) - 20))
+
+    def paint(self, painter, option, index):
+        song = index.data(SongListModel.TrackRole)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        margin = self.SHADOW_MARGIN
+        card = QRectF(option.rect.left() + margin, option.rect.top() + margin,
+                      self.card_size.width(), self.card_size.height())
+
+        painter.save()
+        painter.drawPixmap(option.rect.topLeft(),
+                           self._background(painter.device().devicePixelRatioF(), hovered))
+
+        cover_left = card.left() + (card.width() - self.COVER_SIZE.width()) / 2
+        painter.drawPixmap(int(cover_left), int(card.top()) + 10, self._cover(song))
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        text_top = card.top() + 10 + self.COVER_SIZE.height() + 8
+        title_rect = QRectF(card.left() + 10, text_top, card.width() - 20, self._title_height)
+        self._draw_label(painter, title_rect, song.get('title', 'Unknown'),
+                         self.title_font, self._title_color, True)
+        artist_rect = QRectF(card.left() + 10, title_rect.bottom() + 4, card.width() - 20, self._artist_height)
+        self._draw_label(painter, artist_rect, song.get('artist', 'Unknown'),
+                         self.artist_font, self._text_color, False)
+        painter.restore()
 
 
 class HomePage(QWidget):
@@ -26,7 +490,9 @@ class HomePage(QWidget):
         self.main_window = main_window
         self.current_playlist = "Recently Added"
         self._temp_cover_files = []  # список тимчасових файлів, які ми створюємо при вилученні обкладинок
+        self._applied_theme = None  # тема, кольори якої вже застосовані до карток
         self.context_menu_track = None  # Трек для контекстного меню
+        self._track_menu = None  # Контекстне меню трека, створюється при першому виклику
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -40,15 +506,37 @@ class HomePage(QWidget):
         self.refresh_library()
 
     def add_music_library_section(self, layout):
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFixedHeight(800)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea { 
+        # Віртуалізований список: малюються лише видимі картки, а не віджет на кожен трек
+        self.songs_model = SongListModel(self)
+        self.songs_delegate = SongCardDelegate(self.create_default_cover, self)
+
+        self.songs_view = QListView()
+        self.songs_view.setModel(self.songs_model)
+        self.songs_view.setItemDelegate(self.songs_delegate)
+        self.songs_view.setViewMode(QListView.IconMode)
+        self.songs_view.setFlow(QListView.LeftToRight)
+        self.songs_view.setWrapping(True)
+        self.songs_view.setResizeMode(QListView.Adjust)
+        self.songs_view.setMovement(QListView.Static)
+        self.songs_view.setUniformItemSizes(True)
+        self.songs_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.songs_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.songs_view.setFrameShape(QFrame.NoFrame)
+        self.songs_view.setViewportMargins(15, 25, 25, 15)
+        self.songs_view.setMouseTracking(True)
+        self.songs_view.setCursor(Qt.PointingHandCursor)
+        self.songs_view.setFixedHeight(800)
+        self.songs_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.songs_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.songs_view.clicked.connect(self._on_song_index_clicked)
+        self.songs_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.songs_view.customContextMenuRequested.connect(self._on_song_context_menu)
+        self.songs_delegate.cover_loaded.connect(self.songs_view.viewport().update)
+        self.songs_view.setStyleSheet("""
+            QListView { 
                 background-color: transparent; 
                 border: none; 
+                outline: none;
             }
             QScrollBar:horizontal { 
                 background: #404040; 
@@ -76,182 +564,43 @@ class HomePage(QWidget):
             }
         """)
 
-        self.songs_container = QWidget()
-        self.songs_layout = QGridLayout(self.songs_container)
-        self.songs_layout.setContentsMargins(15, 25, 25, 15)
-        self.songs_layout.setSpacing(35)
-
-        scroll_area.setWidget(self.songs_container)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.songs_view)
 
     def refresh_library(self):
         """Оновлює список пісень з поточного плейлиста"""
-        # Очищаємо контейнер
-        for i in reversed(range(self.songs_layout.count())):
-            widget = self.songs_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
         # Отримуємо треки з поточного плейлиста
         if self.current_playlist in self.library.playlists:
             tracks = self.library.get_playlist_tracks(self.current_playlist)
         else:
             tracks = self.library.get_all_tracks()
 
-        # Додаємо пісні
-        for i, song in enumerate(tracks):
-            card = self.create_song_card(song)
-            row = i // 3
-            col = i % 3
-            self.songs_layout.addWidget(card, row, col)
-
-    def create_song_card(self, song):
-        card = QFrame()
-        card.setFixedSize(220, 270)
-        card.setCursor(Qt.PointingHandCursor)
-        card.setStyleSheet("""
-            QFrame { 
-                background-color: rgba(24, 24, 24, 0.7); 
-                border-radius: 20px; 
-            }
-            QFrame:hover { 
-                background-color: rgba(40, 40, 40, 0.85); 
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(card)
-        shadow.setBlurRadius(15)
-        shadow.setOffset(0, 5)
-        shadow.setColor(QColor(0, 0, 0, 120))
-        card.setGraphicsEffect(shadow)
-
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(8)
-
-        def rounded_pixmap(pixmap, radius):
-            size = pixmap.size()
-            rounded = QPixmap(size)
-            rounded.fill(Qt.transparent)
-
-            painter = QPainter(rounded)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, size.width(), size.height(), radius, radius)
-
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, pixmap)
-            painter.end()
-
-            return rounded
-
-        # Іконка з обкладинкою пісні
-        icon_size = QSize(200, 200)
-        icon_label = QLabel()
-        icon_label.setFixedSize(icon_size)
-        icon_label.setAlignment(Qt.AlignCenter)
-
-        # Отримуємо QPixmap для обкладинки (з файлу, з вбудованого тега або з дефолтного генератора)
-        pixmap = self.get_cover_pixmap_for_song(song, icon_size)
-        pixmap = rounded_pixmap(pixmap, radius=10)  # радіус заокруглення
-
-        icon_label.setPixmap(pixmap)
-
-        layout.addWidget(icon_label, alignment=Qt.AlignCenter)
+        # Черга обкладинок скидається лише тоді, коли змінився сам список карток;
+        # вигляд перемалюється пізніше і поставить у чергу видимі обкладинки заново
+        if self.songs_model.set_tracks(tracks):
+            self.songs_delegate.drop_pending_covers()
 
-        # Назва пісні
-        name_label = QLabel(song.get('title', 'Unknown')[:20] + ('...' if len(song.get('title', '')) > 20 else ''))
-        name_label.setFont(QFont("Arial", 24, QFont.Bold))
-        name_label.setStyleSheet("""
-            color: white;
-            background-color: rgba(30, 30, 30, 180);
-            border-radius: 12px;
-            padding: 8px 12px;
-            margin: 4px 0;
-        """)
-        name_label.setWordWrap(True)
-        name_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(name_label)
-
-        # Виконавець
-        artist_label = QLabel(song.get('artist', 'Unknown')[:20] + ('...' if len(song.get('artist', '')) > 20 else ''))
-        artist_label.setFont(QFont("Arial", 16))
-        artist_label.setStyleSheet("""
-            color: #b3b3b3;
-            background-color: rgba(30, 30, 30, 180);
-            border-radius: 12px;
-            padding: 6px 10px;
-            margin: 4px 0;
-        """)
-        artist_label.setWordWrap(True)
-        artist_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(artist_label)
+    def _on_song_index_clicked(self, index):
+        # Лівий клік - відтворення
+        self.play_song(index.data(SongListModel.TrackRole), None)
 
-        # Обробка кліку
-        card.mousePressEvent = lambda event, s=song, p=pixmap: self.on_song_clicked(event, s, p)
+    def _on_song_context_menu(self, position):
+        # Правий клік - контекстне меню
+        index = self.songs_view.indexAt(position)
+        if index.isValid():
+            self.show_track_context_menu(index.data(SongListModel.TrackRole),
+                                         self.songs_view.viewport().mapToGlobal(position))
 
-        return card
+    def create_default_cover(self, title, size):
+        """Створює обкладинку за замовчуванням.
 
-    def get_cover_pixmap_for_song(self, song, icon_size):
-        """Повертає QPixmap обкладинки для пісні.
-        Послідовність спроб:
-         1) Якщо song['cover_path'] існує на диску — завантажити його.
-         2) Спробувати витягти вбудований артефакт з аудіофайлу (через mutagen).
-         3) Згенерувати дефолтну обкладинку.
+        Згенерована картинка залежить лише від назви і розміру, тож кешується
+        в QPixmapCache і повторно не перемальовується.
         """
-        # 1) файл обкладинки явно вказаний
-        if 'cover_path' in song and song['cover_path'] and os.path.exists(song['cover_path']):
-            pixmap = QPixmap(song['cover_path'])
-            if not pixmap.isNull():
-                return pixmap.scaled(icon_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-
-        # 2) Спробувати витягти вбудовану обкладинку з аудіо
-        audio_path = song.get('file_path') or song.get('path') or song.get('filepath')
-        if audio_path and os.path.exists(audio_path) and MutagenFile is not None:
-            try:
-                af = MutagenFile(audio_path)
-                if af is not None:
-                    # mp3 (APIC), or ID3; для mp4/m4a/ogg різні теги
-                    pic_data = None
-                    if hasattr(af, 'tags') and af.tags is not None:
-                        tags = af.tags
-                        # APIC frame (mp3)
-                        if 'APIC:' in str(tags):
-                            for key in tags.keys():
-                                if key.startswith('APIC'):
-                                    pic = tags.get(key)
-                                    if pic and hasattr(pic, 'data'):
-                                        pic_data = pic.data
-                                        break
-                        # For MP4/M4A
-                        if pic_data is None and hasattr(af, 'pictures') and af.pictures:
-                            pic_data = af.pictures[0].data
-                        # For ID3v2 common access
-                        if pic_data is None:
-                            try:
-                                # some containers keep 'covr' or 'metadata_block_picture'
-                                if 'covr' in tags:
-                                    covr = tags.get('covr')
-                                    if covr:
-                                        pic_data = covr[0]
-                            except Exception:
-                                pass
-
-                    if pic_data:
-                        qpix = QPixmap()
-                        if qpix.loadFromData(pic_data):
-                            return qpix.scaled(icon_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            except Exception:
-                # мовчазно пропускаємо помилки читання метаданих
-                pass
-
-        # 3) Фолбек — генеруємо дефолтну обкладинку
-        return self.create_default_cover(song.get('title', 'Unknown'), icon_size)
+        key = f"default_cover:{title}:{size.width()}x{size.height()}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
 
-    def create_default_cover(self, title, size):
-        """Створює обкладинку за замовчуванням"""
         pixmap = QPixmap(size)
         pixmap.fill(Qt.transparent)
 
@@ -280,22 +629,16 @@ class HomePage(QWidget):
 
         center_x, center_y = size.width() // 2, size.height() // 2
         painter.drawEllipse(center_x - 20, center_y - 20, 40, 40)
-        painter.drawRect(center_x - 5, center_y + 20, 10, 40)
         painter.drawEllipse(center_x - 30, center_y - 30, 20, 20)
+        # Прямокутники з цілими координатами згладжування не потребують
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.drawRect(center_x - 5, center_y + 20, 10, 40)
         painter.drawRect(center_x - 35, center_y - 10, 25, 10)
 
         painter.end()
+        QPixmapCache.insert(key, pixmap)
         return pixmap
 
-    def on_song_clicked(self, event, song, cover_pixmap):
-        """Обробка кліку на пісню"""
-        if event.button() == Qt.LeftButton:
-            # Лівий клік - відтворення
-            self.play_song(song, cover_pixmap)
-        elif event.button() == Qt.RightButton:
-            # Правий клік - контекстне меню
-            self.show_track_context_menu(song, event.globalPos())
-
     def play_song(self, song, cover_pixmap):
         """Відтворення пісні"""
         # Відправляємо сигнал
@@ -305,41 +648,46 @@ class HomePage(QWidget):
         if hasattr(self.main_window, 'play_track_by_id'):
             self.main_window.play_track_by_id(song['id'])
 
-    def show_track_context_menu(self, song, global_pos):
-        """Показує контекстне меню для трека"""
-        self.context_menu_track = song
-        menu = QMenu(self)
+    def _build_track_context_menu(self):
+        menu = self._track_menu = QMenu(self)
 
         # Основний пункт меню
-        play_action = menu.addAction("▶ Відтворити")
+        self._play_action = menu.addAction("▶ Відтворити")
         menu.addSeparator()
 
         # Пункти для роботи з плейлистами
-        add_to_playlist_action = menu.addAction("➕ Додати до плейлиста...")
-        remove_from_playlist_action = menu.addAction("➖ Видалити з плейлиста")
+        self._add_to_playlist_action = menu.addAction("➕ Додати до плейлиста...")
+        self._remove_from_playlist_action = menu.addAction("➖ Видалити з плейлиста")
 
         # Додаткові пункти
         menu.addSeparator()
-        show_info_action = menu.addAction("ℹ Інформація про трек")
-        delete_action = menu.addAction("🗑 Видалити трек з бібліотеки")
+        self._show_info_action = menu.addAction("ℹ Інформація про трек")
+        self._delete_action = menu.addAction("🗑 Видалити трек з бібліотеки")
+
+    def show_track_context_menu(self, song, global_pos):
+        """Показує контекстне меню для трека"""
+        self.context_menu_track = song
+        # Меню створюється один раз і використовується повторно
+        if self._track_menu is None:
+            self._build_track_context_menu()
 
         # Визначаємо, чи це системний плейлист
         system_playlists = ['Favorites', 'Recently Added', 'Most Played']
         is_system_playlist = self.current_playlist in system_playlists
-        remove_from_playlist_action.setEnabled(not is_system_playlist)
+        self._remove_from_playlist_action.setEnabled(not is_system_playlist)
 
         # Обробка вибору пунктів меню
-        action = menu.exec_(global_pos)
+        action = self._track_menu.exec_(global_pos)
 
-        if action == play_action:
+        if action == self._play_action:
             self.play_song(song, None)  # cover_pixmap не потрібен, оскільки ми вже на картці
-        elif action == add_to_playlist_action:
+        elif action == self._add_to_playlist_action:
             self.add_track_to_playlist(song)
-        elif action == remove_from_playlist_action:
+        elif action == self._remove_from_playlist_action:
             self.remove_track_from_playlist(song)
-        elif action == show_info_action:
+        elif action == self._show_info_action:
             self.show_track_info(song)
-        elif action == delete_action:
+        elif action == self._delete_action:
             self.delete_track_from_library(song)
 
     def add_track_to_playlist(self, track):
@@ -406,13 +754,8 @@ class HomePage(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            # Видаляємо трек з усіх плейлистів
-            for playlist_name in list(self.library.playlists.keys()):
-                self.library.remove_from_playlist(playlist_name, track['id'])
-
-            # Видаляємо трек з основного списку
-            self.library.tracks = [t for t in self.library.tracks if t['id'] != track['id']]
-            self.library.save_library()
+            # Видаляємо трек з бібліотеки та з усіх плейлистів
+            self.library.remove_track(track['id'])
 
             # Оновлюємо відображення
             self.refresh_library()
@@ -435,31 +778,20 @@ class HomePage(QWidget):
             show_cover = settings.value("show_cover", True, type=bool)
 
             theme = settings.value("theme", "dark", type=str)
-            if theme == "dark":
-                # Оновлюємо кольори карток
-                for i in range(self.songs_layout.count()):
-                    widget = self.songs_layout.itemAt(i).widget()
-                    if widget:
-                        for label in widget.findChildren(QLabel):
-                            if label.font().bold():
-                                label.setStyleSheet("color: white;")
-                            else:
-                                label.setStyleSheet("color: #b3b3b3;")
-            else:
-                # Оновлюємо кольори карток
-                for i in range(self.songs_layout.count()):
-                    widget = self.songs_layout.itemAt(i).widget()
-                    if widget:
-                        for label in widget.findChildren(QLabel):
-                            if label.font().bold():
-                                label.setStyleSheet("color: black;")
-                            else:
-                                label.setStyleSheet("color: #555555;")
+            theme = "dark" if theme == "dark" else "light"
+            # Інші налаштування (гучність тощо) не змінюють кольори карток
+            if theme == self._applied_theme:
+                return
+            self._applied_theme = theme
+            # Кольори підписів карток — у делегаті, достатньо перемалювати видимі
+            self.songs_delegate.set_theme(theme)
+            self.songs_view.viewport().update()
         except Exception as e:
             print(f"Error applying settings to home page: {str(e)}")
 
     def cleanup(self):
         """Очищає тимчасові файли, створені при витягуванні обкладинок"""
+        self.songs_delegate.shutdown()
         for p in self._temp_cover_files:
             try:
                 if os.path.exists(p):
@@ -1,11 +1,53 @@
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFrame, QLineEdit, QScrollArea, QPushButton, \
     QInputDialog, QMessageBox, QMenu, QSizePolicy, QFileDialog
-from PySide6.QtCore import Qt, QSize, Signal, QPoint
-from PySide6.QtGui import QFont, QPixmap, QPainter, QColor, QBrush, QLinearGradient, QAction
+from PySide6.QtCore import Qt, QSize, Signal, QPoint, QTimer
+from PySide6.QtGui import QFont, QPixmap, QPainter, QColor, QBrush, QLinearGradient, QAction, QPixmapCache
 import json
 import os
 import random
 
+from gui_base.home_page import cached_cover_pixmap, CARD_LABEL_COLORS
+
+# Стиль усіх елементів плейлистів. Задається один раз на контейнер, а елементи
+# отримують його через objectName, тож Qt не розбирає QSS для кожного віджета
+PLAYLIST_ITEM_QSS = """
+    QFrame#playlistItem {{
+        background-color: rgba(24, 24, 24, 0.7);
+        border-radius: 15px;
+    }}
+    QFrame#playlistItem:hover {{
+        background-color: rgba(40, 40, 40, 0.85);
+    }}
+    QFrame#playlistItem QLabel#playlistName {{
+        color: {title_color};
+        background-color: rgba(40, 40, 40, 180);
+        border-radius: 15px;
+        padding: 8px 12px;
+    }}
+    QFrame#playlistItem QLabel#playlistCount {{
+        color: {text_color};
+        background-color: rgba(40, 40, 40, 180);
+        border-radius: 15px;
+        padding: 6px 12px;
+    }}
+    QFrame#playlistItem QPushButton#playlistMenuButton {{
+        background-color: transparent;
+        color: white;
+        border: none;
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QFrame#playlistItem QPushButton#playlistMenuButton:hover {{
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 5px;
+    }}
+"""
+
+
+def playlist_item_stylesheet(theme):
+    title_color, text_color = CARD_LABEL_COLORS[theme]
+    return PLAYLIST_ITEM_QSS.format(title_color=title_color, text_color=text_color)
+
 
 class Playlist(QWidget):
     playlist_clicked = Signal(str)  # Сигнал при кліку на плейлист
@@ -56,7 +98,13 @@ class Playlist(QWidget):
         self.search_field = QLineEdit()
         self.search_field.setPlaceholderText("Search playlists...")
         self.search_field.setMinimumHeight(30)
-        self.search_field.textChanged.connect(self.filter_playlists)
+        # Фільтр застосовується після паузи у введенні, а не на кожну літеру;
+        # кожна нова літера перезапускає таймер
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(lambda: self.filter_playlists(self.search_field.text()))
+        self.search_field.textChanged.connect(lambda _text: self._filter_timer.start())
         main_layout.addWidget(self.search_field)
 
         # Прокрутка
@@ -67,6 +115,8 @@ class Playlist(QWidget):
         # Контейнер плейлистів
         self.playlists_container = QWidget()
         self.playlists_container.setObjectName("playlists_container")
+        self.playlists_container.setStyleSheet(playlist_item_stylesheet("dark"))
+        self._applied_theme = "dark"  # тема, стиль якої вже застосований до контейнера
         self.playlists_container.setContextMenuPolicy(Qt.CustomContextMenu)
         self.playlists_container.customContextMenuRequested.connect(self.show_container_context_menu)
 
@@ -142,31 +192,44 @@ class Playlist(QWidget):
 
     def populate_playlists(self):
         """Відображення плейлистів"""
-        # Очищення контейнера
-        while self.playlists_layout.count():
-            child = self.playlists_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        for playlist in self.playlists:
-            item = self.create_playlist_item(playlist)
-            self.playlists_layout.addWidget(item)
-        self.playlists_layout.addStretch()
+        # Один relayout і одне перемальовування на весь список, а не на кожен елемент
+        self.playlists_container.setUpdatesEnabled(False)
+        try:
+            # Очищення контейнера
+            while self.playlists_layout.count():
+                child = self.playlists_layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+
+            for playlist in self.playlists:
+                item = self.create_playlist_item(playlist)
+                self.playlists_layout.addWidget(item)
+            self.playlists_layout.addStretch()
+        finally:
+            self.playlists_container.setUpdatesEnabled(True)
 
     def filter_playlists(self, text):
         """Фільтрація плейлистів за текстом"""
-        for i in range(self.playlists_layout.count()):
-            item = self.playlists_layout.itemAt(i)
-            if not item:
-                continue
-            widget = item.widget()
-            if widget:
-                playlist_name = widget.property('playlist_name')
-                if playlist_name:
-                    widget.setVisible(text.lower() in playlist_name.lower())
-
-    def get_first_track_cover(self, playlist_name):
-        """Отримує обкладинку першого трека в плейлисті (QPixmap або None)"""
+        text = text.lower()
+        self.playlists_container.setUpdatesEnabled(False)
+        try:
+            for i in range(self.playlists_layout.count()):
+                item = self.playlists_layout.itemAt(i)
+                if not item:
+                    continue
+                widget = item.widget()
+                if widget:
+                    playlist_name = widget.property('playlist_name')
+                    if playlist_name:
+                        widget.setVisible(text in playlist_name.lower())
+        finally:
+            self.playlists_container.setUpdatesEnabled(True)
+
+    def get_first_track_cover(self, playlist_name, size):
+        """Отримує обкладинку першого трека в плейлисті, масштабовану до ``size`` (QPixmap або None).
+
+        Обкладинка береться з QPixmapCache, тож перебудова списку не читає файл з диска знову.
+        """
         try:
             if hasattr(self.library, 'playlists') and playlist_name in self.library.playlists:
                 track_ids = self.library.playlists[playlist_name]
@@ -178,27 +241,52 @@ class Playlist(QWidget):
                         track = None
                     if track and track.get('cover_path'):
                         cover_path = track['cover_path']
-                        if cover_path and os.path.exists(cover_path):
-                            pix = QPixmap(cover_path)
-                            if not pix.isNull():
-                                return pix
+                        if cover_path:
+                            return cached_cover_pixmap(cover_path, size)
         except Exception:
             pass
         return None
 
+    def create_placeholder_icon(self, base, icon_size):
+        """Іконка плейлиста без обкладинки: градієнт на основі кольору плейлиста.
+
+        Залежить лише від кольору і розміру, тож малюється один раз і береться
+        з QPixmapCache при кожному перебудуванні списку.
+        """
+        key = f"playlist_placeholder:{base[0]},{base[1]},{base[2]}:{icon_size.width()}x{icon_size.height()}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+
+        pixmap = QPixmap(icon_size)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        gradient = QLinearGradient(0, 0, icon_size.width(), icon_size.height())
+        gradient.setColorAt(0, QColor(*base))
+        gradient.setColorAt(1, QColor(max(0, base[0] // 2),
+                                      max(0, base[1] // 2),
+                                      max(0, base[2] // 2)))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(0, 0, icon_size.width(), icon_size.height(), 10, 10)
+
+        # Нотка
+        note_color = QColor(255, 255, 255, 200)
+        painter.setBrush(QBrush(note_color))
+        painter.drawEllipse(15, 15, 20, 20)
+        painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def create_playlist_item(self, playlist):
         """Створення віджета для одного плейлиста (тепер з контекстним меню на весь елемент)"""
         item = QFrame()
         item.setProperty('playlist_name', playlist['name'])
-        item.setStyleSheet("""
-            QFrame {
-                background-color: rgba(24, 24, 24, 0.7);
-                border-radius: 15px;
-            }
-            QFrame:hover {
-                background-color: rgba(40, 40, 40, 0.85);
-            }
-        """)
+        item.setObjectName("playlistItem")  # стиль задає PLAYLIST_ITEM_QSS контейнера
         item.setMinimumHeight(70)
         item.setCursor(Qt.PointingHandCursor)
 
@@ -217,12 +305,11 @@ class Playlist(QWidget):
         icon_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
         # Спробуємо отримати обкладинку першого трека
-        cover_pixmap = self.get_first_track_cover(playlist["name"])
+        cover_pixmap = self.get_first_track_cover(playlist["name"], icon_size)
 
         if cover_pixmap and not cover_pixmap.isNull():
-            # Використовуємо обкладинку першого трека, обрізаємо в квадрат
-            cover_pixmap = cover_pixmap.scaled(icon_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            # Обрізка до центру, щоб виглядало як квадратна обкладинка
+            # Обкладинка вже масштабована з заповненням — обрізаємо до центру,
+            # щоб виглядало як квадратна обкладинка
             w = cover_pixmap.width()
             h = cover_pixmap.height()
             side = min(w, h)
@@ -232,30 +319,7 @@ class Playlist(QWidget):
             cover_pixmap = cover_pixmap.scaled(icon_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
             icon_label.setPixmap(cover_pixmap)
         else:
-            # Градієнт на основі кольору плейлиста
-            pixmap = QPixmap(icon_size)
-            pixmap.fill(Qt.transparent)
-
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-
-            gradient = QLinearGradient(0, 0, icon_size.width(), icon_size.height())
-            base = playlist.get("color", [100, 100, 100])
-            gradient.setColorAt(0, QColor(*base))
-            gradient.setColorAt(1, QColor(max(0, base[0] // 2),
-                                          max(0, base[1] // 2),
-                                          max(0, base[2] // 2)))
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(0, 0, icon_size.width(), icon_size.height(), 10, 10)
-
-            # Нотка
-            note_color = QColor(255, 255, 255, 200)
-            painter.setBrush(QBrush(note_color))
-            painter.drawEllipse(15, 15, 20, 20)
-            painter.end()
-
-            icon_label.setPixmap(pixmap)
+            icon_label.setPixmap(self.create_placeholder_icon(playlist.get("color", [100, 100, 100]), icon_size))
 
         layout.addWidget(icon_label)
 
@@ -263,7 +327,7 @@ class Playlist(QWidget):
         text_layout = QVBoxLayout()
         name_label = QLabel(playlist["name"])
         name_label.setFont(QFont("Arial", 12, QFont.Bold))
-        name_label.setStyleSheet("color: white; background-color: rgba(40, 40, 40, 180); border-radius: 15px; padding: 8px 12px;")
+        name_label.setObjectName("playlistName")
         text_layout.addWidget(name_label)
 
         # Отримуємо кількість треків з основної бібліотеки
@@ -276,7 +340,7 @@ class Playlist(QWidget):
 
         count_label = QLabel(f"{track_count} tracks")
         count_label.setFont(QFont("Arial", 10))
-        count_label.setStyleSheet("color: #b3b3b3; background-color: rgba(40, 40, 40, 180); border-radius: 15px; padding: 6px 12px;")
+        count_label.setObjectName("playlistCount")
         text_layout.addWidget(count_label)
 
         layout.addLayout(text_layout)
@@ -285,19 +349,7 @@ class Playlist(QWidget):
         # Кнопка контекстного меню (алтернативний спосіб)
         context_btn = QPushButton("⋮")
         context_btn.setFixedSize(30, 30)
-        context_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-            }
-        """)
+        context_btn.setObjectName("playlistMenuButton")
         context_btn.clicked.connect(lambda _, p=playlist, btn=context_btn: self.show_playlist_context_menu(p, btn.mapToGlobal(QPoint(0, btn.height()))))
         layout.addWidget(context_btn)
 
@@ -444,22 +496,12 @@ class Playlist(QWidget):
         self.settings = settings
         theme = settings.value("theme", "dark", type=str) if hasattr(settings, 'value') else "dark"
 
-        # Оновлення стилів відповідно до теми
-        for i in range(self.playlists_layout.count()):
-            widget = self.playlists_layout.itemAt(i).widget()
-            if widget:
-                # Оновлення кольору тексту
-                for label in widget.findChildren(QLabel):
-                    if label.font().bold():
-                        if theme == "dark":
-                            label.setStyleSheet("color: white;")
-                        else:
-                            label.setStyleSheet("color: black;")
-                    else:
-                        if theme == "dark":
-                            label.setStyleSheet("color: #b3b3b3;")
-                        else:
-                            label.setStyleSheet("color: #555555;")
+        theme = "dark" if theme == "dark" else "light"
+        # Один стиль на контейнер замість окремого setStyleSheet для кожного підпису;
+        # інші налаштування кольорів не змінюють
+        if theme != self._applied_theme:
+            self._applied_theme = theme
+            self.playlists_container.setStyleSheet(playlist_item_stylesheet(theme))
 
     # --- Допоміжні методи для імпорту/експорту ---
     def export_playlist(self, playlist):
@@ -3,11 +3,91 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 
+# Page stylesheet per theme, parsed by Qt only when the theme actually changes
+THEME_STYLESHEETS = {
+    "dark": """
+        #settingsFrame {
+            background-color: #252525;
+            border-radius: 10px;
+            border: 1px solid #333;
+        }
+        QLabel {
+            color: #e0e0e0;
+        }
+        QComboBox, QCheckBox {
+            background-color: #353535;
+            color: #e0e0e0;
+            border: 1px solid #444;
+            padding: 5px;
+            border-radius: 4px;
+        }
+        QComboBox::drop-down {
+            border: none;
+        }
+        QSlider::groove:horizontal {
+            border: 1px solid #444;
+            height: 8px;
+            background: #353535;
+            margin: 2px 0;
+            border-radius: 4px;
+        }
+        QSlider::handle:horizontal {
+            background: #1DB954;
+            border: 1px solid #179944;
+            width: 18px;
+            margin: -2px 0;
+            border-radius: 9px;
+        }
+        QSlider::handle:horizontal:hover {
+            background: #1ed760;
+        }
+""",
+    "light": """
+        #settingsFrame {
+            background-color: #ffffff;
+            border-radius: 10px;
+            border: 1px solid #ddd;
+        }
+        QLabel {
+            color: #333333;
+        }
+        QComboBox, QCheckBox {
+            background-color: #f5f5f5;
+            color: #333333;
+            border: 1px solid #ddd;
+            padding: 5px;
+            border-radius: 4px;
+        }
+        QComboBox::drop-down {
+            border: none;
+        }
+        QSlider::groove:horizontal {
+            border: 1px solid #ddd;
+            height: 8px;
+            background: #f5f5f5;
+            margin: 2px 0;
+            border-radius: 4px;
+        }
+        QSlider::handle:horizontal {
+            background: #1DB954;
+            border: 1px solid #179944;
+            width: 18px;
+            margin: -2px 0;
+            border-radius: 9px;
+        }
+        QSlider::handle:horizontal:hover {
+            background: #1ed760;
+        }
+""",
+}
+
+
 class SettingsPage(QWidget):
     def __init__(self, settings, apply_callback):
         super().__init__()
         self.settings = settings
         self.apply_callback = apply_callback
+        self._applied_theme = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(25, 25, 25, 25)
@@ -73,82 +153,12 @@ class SettingsPage(QWidget):
         self.apply_styling()
 
     def apply_styling(self):
-        if self.settings.value("theme", "dark", type=str) == "dark":
-            self.setStyleSheet("""
-                #settingsFrame {
-                    background-color: #252525;
-                    border-radius: 10px;
-                    border: 1px solid #333;
-                }
-                QLabel {
-                    color: #e0e0e0;
-                }
-                QComboBox, QCheckBox {
-                    background-color: #353535;
-                    color: #e0e0e0;
-                    border: 1px solid #444;
-                    padding: 5px;
-                    border-radius: 4px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QSlider::groove:horizontal {
-                    border: 1px solid #444;
-                    height: 8px;
-                    background: #353535;
-                    margin: 2px 0;
-                    border-radius: 4px;
-                }
-                QSlider::handle:horizontal {
-                    background: #1DB954;
-                    border: 1px solid #179944;
-                    width: 18px;
-                    margin: -2px 0;
-                    border-radius: 9px;
-                }
-                QSlider::handle:horizontal:hover {
-                    background: #1ed760;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                #settingsFrame {
-                    background-color: #ffffff;
-                    border-radius: 10px;
-                    border: 1px solid #ddd;
-                }
-                QLabel {
-                    color: #333333;
-                }
-                QComboBox, QCheckBox {
-                    background-color: #f5f5f5;
-                    color: #333333;
-                    border: 1px solid #ddd;
-                    padding: 5px;
-                    border-radius: 4px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QSlider::groove:horizontal {
-                    border: 1px solid #ddd;
-                    height: 8px;
-                    background: #f5f5f5;
-                    margin: 2px 0;
-                    border-radius: 4px;
-                }
-                QSlider::handle:horizontal {
-                    background: #1DB954;
-                    border: 1px solid #179944;
-                    width: 18px;
-                    margin: -2px 0;
-                    border-radius: 9px;
-                }
-                QSlider::handle:horizontal:hover {
-                    background: #1ed760;
-                }
-            """)
+        theme = "dark" if self.settings.value("theme", "dark", type=str) == "dark" else "light"
+        # Every settings change ends up here; only a theme switch needs a new stylesheet
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+        self.setStyleSheet(THEME_STYLESHEETS[theme])
 
     def update_theme(self, text):
         self.settings.setValue("theme", text.lower())
@@ -0,0 +1,114 @@
+"""
+ID3 Reader Module
+
+Minimal ID3v2.3/2.4 reader used by the library scanner. It reads only the
+tag block at the start of an MP3 file and decodes just the frames the
+library stores, skipping mutagen's per-frame object construction.
+Anything it does not understand is reported as None so the caller can
+fall back to mutagen.
+"""
+
+from typing import Dict, Optional, Any
+
+# Text frames the library uses; TYER is the ID3v2.3 name of TDRC
+TEXT_FRAMES = {'TIT2', 'TPE1', 'TALB', 'TCON', 'TRCK', 'TDRC', 'TYER'}
+
+_TEXT_ENCODINGS = ('latin-1', 'utf-16', 'utf-16-be', 'utf-8')
+_HEADER_SIZE = 10
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _decode_text(payload: bytes) -> str:
+    if not payload:
+        return ''
+    encoding = payload[0]
+    if encoding > 3:
+        raise ValueError(f"Unknown text encoding {encoding}")
+    text = payload[1:].decode(_TEXT_ENCODINGS[encoding], errors='replace')
+    # Multiple values are NUL-separated, the library keeps the first one
+    return text.split('\x00', 1)[0]
+
+
+def _decode_apic(data: bytes, start: int, end: int) -> Dict[str, Any]:
+    # Works on the tag buffer in place: the picture is the only large frame and
+    # is copied out exactly once
+    encoding = data[start]
+    mime_end = data.index(b'\x00', start + 1, end)
+    mime = data[start + 1:mime_end].decode('latin-1', errors='replace')
+    pos = mime_end + 2  # skip terminator and picture type
+    if encoding in (1, 2):
+        # UTF-16 description ends with an aligned double NUL
+        while pos + 1 < end and data[pos:pos + 2] != b'\x00\x00':
+            pos += 2
+        pos += 2
+    else:
+        pos = data.index(b'\x00', pos, end) + 1
+    return {'mime': mime, 'data': data[pos:end]}
+
+
+def read_id3_tags(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the frames used by the library from an ID3v2 tag.
+
+    Args:
+        file_path: Path to an MP3 file
+
+    Returns:
+        Dictionary with decoded text frames, 'APIC' ({'mime', 'data'}) if a
+        picture is present and 'tag_size' (bytes occupied by the tag), or
+        None if the file has no ID3v2.3/2.4 tag or uses features this reader
+        does not handle (unsynchronisation, compression, encryption,
+        grouping, data length indicators)
+    """
+    with open(file_path, 'rb') as f:
+        header = f.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE or header[:3] != b'ID3':
+            return None
+        version, flags = header[3], header[5]
+        if version not in (3, 4) or flags & 0x80:
+            return None
+        size = _syncsafe(header[6:10])
+        data = f.read(size)
+
+    tag_size = _HEADER_SIZE + size + (_HEADER_SIZE if flags & 0x10 else 0)
+    pos = 0
+    if flags & 0x40:
+        # Extended header: v2.4 size includes itself, v2.3 size excludes its 4 bytes
+        ext_size = data[0:4]
+        pos = _syncsafe(ext_size) if version == 4 else int.from_bytes(ext_size, 'big') + 4
+
+    result: Dict[str, Any] = {'tag_size': tag_size}
+    end = len(data)
+    while pos + _HEADER_SIZE <= end:
+        frame_id = data[pos:pos + 4]
+        if not frame_id.isalnum():
+            break  # padding
+        size_bytes = data[pos + 4:pos + 8]
+        frame_size = _syncsafe(size_bytes) if version == 4 else int.from_bytes(size_bytes, 'big')
+        format_flags = data[pos + 9]
+        payload_start = pos + _HEADER_SIZE
+        pos = payload_start + frame_size
+        if pos > end:
+            break
+
+        frame_id = frame_id.decode('latin-1')
+        if frame_id not in TEXT_FRAMES and (frame_id != 'APIC' or 'APIC' in result):
+            continue
+        # v2.4: 0x40 grouping, 0x08 compression, 0x04 encryption, 0x02 unsync,
+        # 0x01 data length indicator; v2.3: 0x80 compression, 0x40 encryption,
+        # 0x20 grouping. All of them change or prefix the frame data
+        if format_flags & (0x4F if version == 4 else 0xE0):
+            return None
+
+        try:
+            if frame_id == 'APIC':
+                result['APIC'] = _decode_apic(data, payload_start, pos)
+            else:
+                result['TDRC' if frame_id == 'TYER' else frame_id] = _decode_text(data[payload_start:pos])
+        except (ValueError, IndexError):
+            return None
+
+    return result
@@ -3,49 +3,172 @@ import os
 import json
 import shutil
 import hashlib
-from pathlib import Path
+import sqlite3
+import time
+import logging
 from datetime import datetime
+from functools import lru_cache
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QStackedWidget, QProgressBar, QPushButton, QLabel, QFrame,
+    QStackedWidget, QPushButton, QLabel, QFrame,
     QFileDialog, QMessageBox, QMenu, QInputDialog, QListWidget, QListWidgetItem,
-    QScrollArea, QSizePolicy
+    QSizePolicy, QListView, QAbstractItemView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, QSize, QSettings, QTimer, QThread, Signal, QUrl, QRectF
-from PySide6.QtGui import QIcon, QPalette, QColor, QFont, QPixmap, QPainter, QBrush, QLinearGradient, QPainterPath
+from PySide6.QtCore import Qt, QSize, QSettings, QTimer, QThread, Signal, Slot, QUrl, QRectF, QObject, QRunnable, \
+    QThreadPool, QAbstractListModel, QModelIndex, QEvent
+from PySide6.QtGui import QIcon, QPalette, QColor, QFont, QPixmap, QPainter, QBrush, QLinearGradient, QPainterPath, \
+    QPixmapCache, QPen, QFontMetrics
 
-from gui_base.home_page import HomePage
+from gui_base.home_page import HomePage, cached_cover_pixmap, COVER_CACHE_LIMIT_KB
 from gui_base.playist_page import Playlist
 from gui_base.settings_page import SettingsPage
 from engine_sound import AudioEngine, _HAVE_VLC
+from id3_reader import read_id3_tags
+
+logger = logging.getLogger(__name__)
 
 SETTINGS_ORG = "PlayerV"
 SETTINGS_APP = "Player"
 
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac')
+_AUDIO_EXTENSION_SET = frozenset(AUDIO_EXTENSIONS)
+# seconds, caps position-driven UI updates at 20 Hz; kept below the engines' own
+# 100 ms position step so timer jitter does not drop every other engine tick
+PROGRESS_UPDATE_INTERVAL = 0.05
+SKIP_DEBOUNCE_MS = 150  # prev/next presses closer than this load only the last track
+
+
+_PROGRESS_GRADIENT = [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)]
+
+# Progress bar colours per theme, built once (RoundedProgressBar paints with these)
+PROGRESS_BAR_COLORS = {
+    "dark": (QColor(60, 60, 60, 200), _PROGRESS_GRADIENT),
+    "light": (QColor(200, 200, 200, 200), _PROGRESS_GRADIENT),
+    "default": (QColor(60, 60, 60, 200), _PROGRESS_GRADIENT),
+}
+
+# Colours used on paint paths, created once instead of per paintEvent
+_PROGRESS_BORDER_PEN = QPen(QColor(255, 255, 255, 10))
+_CARD_TITLE_COLOR = QColor("#ffffff")
+_CARD_COUNT_COLOR = QColor("#b3b3b3")
+
+_PROGRESS_BAR_QSS = """
+    QProgressBar {{
+        background: {background};
+        border-radius: 7px;
+        border: none;
+    }}
+    QProgressBar::chunk {{
+        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(29, 185, 84, 1),
+            stop:0.5 rgba(35, 200, 95, 1),
+            stop:1 rgba(29, 185, 84, 1));
+        border-radius: 7px;
+    }}
+"""
+
+# Stylesheets for a plain QProgressBar, built once
+PROGRESS_BAR_STYLESHEETS = {
+    "dark": _PROGRESS_BAR_QSS.format(background="rgba(50, 50, 50, 200)"),
+    "light": _PROGRESS_BAR_QSS.format(background="rgba(200, 200, 200, 200)"),
+    "default": _PROGRESS_BAR_QSS.format(background="rgba(60, 60, 60, 200)"),
+}
+
+
+def load_asset_icon(path):
+    """Return QIcon for an asset file, or an empty icon if the file is missing."""
+    return QIcon(path) if os.path.exists(path) else QIcon()
 
 
 
-class RoundedProgressBar(QProgressBar):
+
+class RoundedProgressBar(QWidget):
+    """Progress line painted entirely in paintEvent.
+
+    Keeps the value/range part of the QProgressBar API the window uses, but
+    setValue schedules a plain update() instead of QProgressBar's
+    style-driven synchronous repaint.
+    """
 
     def __init__(self, parent=None, height: int = 14):
         super().__init__(parent)
-        self.setTextVisible(False)
-        self.setRange(0, 1000)
-        self.setValue(0)
+        self._minimum = 0
+        self._maximum = 1000
+        self._value = 0
         self.setFixedHeight(height)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
 
-        self._bg_color = QColor(60, 60, 60, 200)
-        self._grad_colors = [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)]
+        self._bg_color, grad_colors = PROGRESS_BAR_COLORS["default"]
+        self._grad_stops = self._gradient_stops(grad_colors)
 
 
         self._last_painted_value = None
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
 
+        # Track (background and border) rasterised once; a resize or colour change
+        # only marks it stale and the next paint rebuilds it, so a burst of resizes
+        # between two paints costs a single rebuild
+        self._rect = QRectF()
+        self._radius = 0.0
+        self._track = None
+
+    def _rebuild_track(self, dpr):
+        self._rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        self._radius = self._rect.height() / 2.0
+        path = QPainterPath()
+        path.addRoundedRect(self._rect, self._radius, self._radius)
+
+        self._track = QPixmap(self.size() * dpr)
+        self._track.setDevicePixelRatio(dpr)
+        self._track.fill(Qt.transparent)
+        painter = QPainter(self._track)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillPath(path, self._bg_color)
+        # subtle border for crispness
+        painter.strokePath(path, _PROGRESS_BORDER_PEN)
+        painter.end()
+
+    def resizeEvent(self, event):
+        self._track = None
+        super().resizeEvent(event)
+
+    def minimum(self):
+        return self._minimum
+
+    def maximum(self):
+        return self._maximum
+
+    def value(self):
+        return self._value
+
+    def setRange(self, minimum, maximum):
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        self._value = min(max(self._value, self._minimum), self._maximum)
+        self.update()
+
+    def setValue(self, value):
+        # Same rule as QProgressBar: out-of-range values are ignored
+        if value == self._value or not self._minimum <= value <= self._maximum:
+            return
+        self._value = value
+        # The whole bar: the chunk gradient stretches with the value, so every
+        # pixel of it changes. With the track cached this is one blit and one fill
+        self.update()
+
+    @staticmethod
+    def _gradient_stops(grad_colors):
+        """Gradient stops for the chunk, computed when the colours change rather than per paint"""
+        if len(grad_colors) >= 3:
+            return [(0.0, grad_colors[0]), (0.5, grad_colors[1]), (1.0, grad_colors[2])]
+        return [(0.0, grad_colors[0]), (1.0, grad_colors[-1])]
+
     def set_colors(self, bg_color: QColor, grad_colors: list):
         self._bg_color = bg_color
-        self._grad_colors = grad_colors
+        self._grad_stops = self._gradient_stops(grad_colors)
+        self._track = None
         self.update()
 
     def paintEvent(self, event):
@@ -54,16 +177,21 @@ class RoundedProgressBar(QProgressBar):
         if self._last_painted_value == current_value and (event.rect().width() == 0 or event.rect().height() == 0):
             return
 
+        dpr = self.devicePixelRatioF()
+        if self._track is None or self._track.devicePixelRatio() != dpr:
+            self._rebuild_track(dpr)
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Partial exposes (overlapping windows, tooltips) only rasterise the damaged part
+        painter.setClipRect(event.rect())
 
-        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
-        radius = rect.height() / 2.0
+        rect = self._rect
+        radius = self._radius
 
-        # Draw background rounded rect
+        # Background rounded rect with its border
+        painter.drawPixmap(0, 0, self._track)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(self._bg_color))
-        painter.drawRoundedRect(rect, radius, radius)
 
         # Draw foreground (chunk) with gradient
         minimum = self.minimum()
@@ -74,226 +202,321 @@ class RoundedProgressBar(QProgressBar):
             fg_rect = QRectF(rect.x(), rect.y(), fg_width, rect.height())
 
             grad = QLinearGradient(fg_rect.topLeft(), fg_rect.topRight())
-            if len(self._grad_colors) >= 3:
-                grad.setColorAt(0.0, self._grad_colors[0])
-                grad.setColorAt(0.5, self._grad_colors[1])
-                grad.setColorAt(1.0, self._grad_colors[2])
-            elif len(self._grad_colors) == 2:
-                grad.setColorAt(0.0, self._grad_colors[0])
-                grad.setColorAt(1.0, self._grad_colors[1])
-            else:
-                grad.setColorAt(0.0, self._grad_colors[0])
-                grad.setColorAt(1.0, self._grad_colors[0])
+            grad.setStops(self._grad_stops)
 
-            painter.setBrush(QBrush(grad))
+            painter.setBrush(grad)
             # Rounded rect ensures circular ends even for fg_width < height
             painter.drawRoundedRect(fg_rect, radius, radius)
 
-        # subtle border for crispness
-        painter.setPen(QColor(255, 255, 255, 10))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(rect, radius, radius)
-
         painter.end()
         self._last_painted_value = current_value
 
 
-class PlaylistItem(QFrame):
-    """Custom widget for displaying a playlist with collage of up to 4 track covers"""
+def create_playlist_collage(tracks):
+    """Collage of up to 4 track covers (2x2 grid) for a playlist"""
+    collage_size = QSize(150, 150)
+    cell_size = QSize(72, 72)
+    spacing = 3
+
+    collage = QPixmap(collage_size)
+    collage.fill(Qt.transparent)
+
+    painter = QPainter(collage)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # Build list of pixmaps or None
+    track_covers = []
+    for track in tracks[:4]:
+        cover_path = track.get('cover_path')
+        track_covers.append(cached_cover_pixmap(cover_path, cell_size) if cover_path else None)
+
+    # Ensure length 4
+    while len(track_covers) < 4:
+        track_covers.append(None)
+
+    positions = [
+        (0, 0), (1, 0),
+        (0, 1), (1, 1)
+    ]
+
+    for i, (row, col) in enumerate(positions):
+        x = col * (cell_size.width() + spacing)
+        y = row * (cell_size.height() + spacing)
+
+        if track_covers[i] is not None:
+            # Draw the pre-scaled cover with rounded clipping using QPainterPath
+            scaled = track_covers[i]
+            # center
+            draw_x = x + (cell_size.width() - scaled.width()) // 2
+            draw_y = y + (cell_size.height() - scaled.height()) // 2
+
+            path = QPainterPath()
+            path.addRoundedRect(draw_x, draw_y, cell_size.width(), cell_size.height(), 8, 8)
+            painter.setClipPath(path)
+            painter.drawPixmap(draw_x, draw_y, scaled)
+            painter.setClipping(False)
+        else:
+            painter.setBrush(QBrush(QColor(80, 80, 80, 180)))
+            painter.setPen(Qt.NoPen)
+            painter.drawRoundedRect(x, y, cell_size.width(), cell_size.height(), 8, 8)
 
-    playlist_clicked = Signal(str, list)  # Emits playlist name and tracks when clicked
+            painter.setBrush(QBrush(QColor(200, 200, 200, 150)))
+            note_size = 24
+            note_x = x + (cell_size.width() - note_size) // 2
+            note_y = y + (cell_size.height() - note_size) // 2
+            painter.drawEllipse(note_x, note_y, note_size, note_size)
 
-    def __init__(self, playlist_name, tracks, library):
-        super().__init__()
-        self.playlist_name = playlist_name
-        self.tracks = tracks
-        self.library = library
-        self._selected = False
-        self.setFixedHeight(200)  # Large playlist items
-        self.setCursor(Qt.PointingHandCursor)
-        self.setObjectName("playlistItem")
-        self.init_ui()
-        self.update_style()
+    painter.end()
+    return collage
 
-    def init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-
-        # Playlist collage (2x2 grid of track covers)
-        self.collage_label = QLabel()
-        self.collage_label.setFixedSize(150, 150)
-        self.collage_label.setAlignment(Qt.AlignCenter)
-        self.collage_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(60, 60, 60, 0.5);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
 
-        # Create the collage
-        collage_pixmap = self.create_playlist_collage()
-        self.collage_label.setPixmap(collage_pixmap)
+class PlaylistListModel(QAbstractListModel):
+    """Playlists of the library as a flat list; rows are painted by PlaylistItemDelegate"""
 
-        layout.addWidget(self.collage_label, alignment=Qt.AlignCenter)
+    TracksRole = Qt.UserRole + 1
 
-        # Playlist title and track count
-        title_layout = QVBoxLayout()
-        title_layout.setSpacing(2)
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self._names = []
+
+    def refresh(self):
+        self.beginResetModel()
+        self._names = list(self.library.playlists)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self._names[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == self.TracksRole:
+            return self.tracks(name)
+        return None
 
-        # Playlist title
-        title_label = QLabel(self.playlist_name)
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #ffffff;")
-        title_label.setWordWrap(True)
-        title_layout.addWidget(title_label)
+    def tracks(self, name):
+        # Resolved lazily, only for rows that get painted or clicked
+        return self.library.get_playlist_tracks(name)
 
-        # Track count
-        track_count = len(self.tracks)
-        count_label = QLabel(f"{track_count} track{'s' if track_count != 1 else ''}")
-        count_label.setFont(QFont("Segoe UI", 9))
-        count_label.setAlignment(Qt.AlignCenter)
-        count_label.setStyleSheet("color: #b3b3b3;")
-        title_layout.addWidget(count_label)
+    def row_of(self, name):
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
 
-        layout.addLayout(title_layout)
 
-        # Connect click event
-        self.mousePressEvent = self.on_click
+class PlaylistItemDelegate(QStyledItemDelegate):
+    """Paints a playlist row: cover collage, title and track count"""
 
-    def create_playlist_collage(self):
-        collage_size = QSize(150, 150)
-        cell_size = QSize(72, 72)
-        spacing = 3
+    ITEM_HEIGHT = 200
+    COLLAGE_SIZE = 150
+    COLLAGE_CACHE_LIMIT = 256
 
-        collage = QPixmap(collage_size)
-        collage.fill(Qt.transparent)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        self.count_font = QFont("Segoe UI", 9)
+        self.title_metrics = QFontMetrics(self.title_font)
+        # Collages keyed by the cover paths they are built from; tracks without
+        # a cover all draw the same placeholder
+        self._collages = {}
+        # Card backgrounds keyed by (width, height, dpr, selected, hovered)
+        self._backgrounds = {}
+        # Elided titles keyed by (name, width); text shaping is the costliest part of a row
+        self._titles = {}
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ITEM_HEIGHT)
+
+    def _collage(self, tracks):
+        key = tuple(track.get('cover_path') for track in tracks[:4])
+        collage = self._collages.get(key)
+        if collage is None:
+            if len(self._collages) >= self.COLLAGE_CACHE_LIMIT:
+                self._collages.clear()
+            collage = self._collages[key] = create_playlist_collage(tracks)
+        return collage
 
-        painter = QPainter(collage)
+    def _collage_rect(self, rect):
+        return QRectF(rect.center().x() - self.COLLAGE_SIZE / 2, rect.top() + 10,
+                      self.COLLAGE_SIZE, self.COLLAGE_SIZE)
+
+    def _elided_title(self, name, width):
+        key = (name, width)
+        title = self._titles.get(key)
+        if title is None:
+            if len(self._titles) >= self.COLLAGE_CACHE_LIMIT:
+                self._titles.clear()
+            title = self._titles[key] = self.title_metrics.elidedText(name, Qt.ElideRight, width)
+        return title
+
+    def _background(self, size, dpr, selected, hovered):
+        """Card and collage frame, rasterised once per size and state"""
+        key = (size.width(), size.height(), dpr, selected, hovered)
+        background = self._backgrounds.get(key)
+        if background is not None:
+            return background
+
+        background = QPixmap(size * dpr)
+        background.setDevicePixelRatio(dpr)
+        background.fill(Qt.transparent)
+        painter = QPainter(background)
         painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(0, 0, size.width(), size.height()).adjusted(2, 2, -2, -2)
 
-        # Build list of pixmaps or None
-        track_covers = []
-        for track in self.tracks[:4]:
-            cover_path = track.get('cover_path')
-            if cover_path and os.path.exists(cover_path):
-                pixmap = QPixmap(cover_path)
-                if not pixmap.isNull():
-                    track_covers.append(pixmap)
-                    continue
-            track_covers.append(None)
-
-        # Ensure length 4
-        while len(track_covers) < 4:
-            track_covers.append(None)
-
-        positions = [
-            (0, 0), (1, 0),
-            (0, 1), (1, 1)
-        ]
-
-        for i, (row, col) in enumerate(positions):
-            x = col * (cell_size.width() + spacing)
-            y = row * (cell_size.height() + spacing)
-
-            if track_covers[i] is not None:
-                # Scale and draw with rounded clipping using QPainterPath
-                scaled = track_covers[i].scaled(cell_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                # center
-                draw_x = x + (cell_size.width() - scaled.width()) // 2
-                draw_y = y + (cell_size.height() - scaled.height()) // 2
-
-                path = QPainterPath()
-                path.addRoundedRect(draw_x, draw_y, cell_size.width(), cell_size.height(), 8, 8)
-                painter.setClipPath(path)
-                painter.drawPixmap(draw_x, draw_y, scaled)
-                painter.setClipping(False)
-            else:
-                painter.setBrush(QBrush(QColor(80, 80, 80, 180)))
-                painter.setPen(Qt.NoPen)
-                painter.drawRoundedRect(x, y, cell_size.width(), cell_size.height(), 8, 8)
-
-                painter.setBrush(QBrush(QColor(200, 200, 200, 150)))
-                note_size = 24
-                note_x = x + (cell_size.width() - note_size) // 2
-                note_y = y + (cell_size.height() - note_size) // 2
-                painter.drawEllipse(note_x, note_y, note_size, note_size)
+        # Card background, same colours the per-widget stylesheet used
+        if selected:
+            painter.setBrush(QColor(29, 185, 84, 102 if hovered else 77))
+            painter.setPen(QPen(QColor(29, 185, 84, 153), 2))
+        else:
+            painter.setBrush(QColor(60, 60, 60, 230) if hovered else QColor(40, 40, 40, 204))
+            painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect, 14, 14)
 
+        painter.setBrush(QColor(60, 60, 60, 128))
+        painter.setPen(QPen(QColor(255, 255, 255, 25), 1))
+        painter.drawRoundedRect(self._collage_rect(rect), 10, 10)
         painter.end()
-        return collage
 
-    def setSelected(self, selected):
-        self._selected = selected
-        self.update_style()
-
-    def update_style(self):
-        if self._selected:
-            self.setStyleSheet("""
-                QFrame#playlistItem {
-                    background-color: rgba(29, 185, 84, 0.3);
-                    border: 2px solid rgba(29, 185, 84, 0.6);
-                    border-radius: 14px;
-                    margin: 2px;
-                }
-                QFrame#playlistItem:hover {
-                    background-color: rgba(29, 185, 84, 0.4);
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame#playlistItem {
-                    background-color: rgba(40, 40, 40, 0.8);
-                    border-radius: 14px;
-                    margin: 2px;
-                }
-                QFrame#playlistItem:hover {
-                    background-color: rgba(60, 60, 60, 0.9);
-                }
-            """)
+        # Only a handful of states per width; a resize makes the old ones stale
+        if len(self._backgrounds) >= 16:
+            self._backgrounds.clear()
+        self._backgrounds[key] = background
+        return background
 
-    def on_click(self, event):
-        if event.button() == Qt.LeftButton:
-            self.playlist_clicked.emit(self.playlist_name, self.tracks)
-        super().mousePressEvent(event)
+    def paint(self, painter, option, index):
+        name = index.data(Qt.DisplayRole)
+        tracks = index.data(PlaylistListModel.TracksRole)
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        rect = QRectF(option.rect).adjusted(2, 2, -2, -2)
 
+        painter.save()
+        painter.drawPixmap(option.rect.topLeft(), self._background(
+            option.rect.size(), painter.device().devicePixelRatioF(), selected, hovered))
+
+        collage_rect = self._collage_rect(rect)
+        painter.drawPixmap(collage_rect.topLeft(), self._collage(tracks))
+
+        text_rect = QRectF(rect.left() + 12, collage_rect.bottom() + 4, rect.width() - 24, 20)
+        painter.setFont(self.title_font)
+        painter.setPen(_CARD_TITLE_COLOR)
+        title = self._elided_title(name, int(text_rect.width()))
+        painter.drawText(text_rect, Qt.AlignCenter, title)
+
+        track_count = len(tracks)
+        painter.setFont(self.count_font)
+        painter.setPen(_CARD_COUNT_COLOR)
+        painter.drawText(text_rect.translated(0, 18), Qt.AlignCenter,
+                         f"{track_count} track{'s' if track_count != 1 else ''}")
+
+        painter.restore()
+
+
+class MusicScanner(QObject):
+    """Reads track metadata off the GUI thread.
+
+    One instance lives on a dedicated QThread for the whole session; scan
+    requests arrive as queued signal calls and are served one at a time.
+    """
 
-class MusicScanner(QThread):
     scan_progress = Signal(int, int)
-    scan_complete = Signal(list)
+    scan_complete = Signal(str, list)  # request tag, tracks
 
     def __init__(self, music_dir):
         super().__init__()
         self.music_dir = music_dir
+        # Tracks read during this session: path -> ((mtime_ns, size), track snapshot).
+        # Refreshes re-read only files that changed since the previous scan.
+        self._track_cache = {}
+        # Set from the GUI thread on close; a running scan stops at the next file
+        self._abort = False
 
-    def run(self):
-        extensions = ['.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac']
-        all_files = []
-        for ext in extensions:
-            all_files.extend(list(Path(self.music_dir).rglob(f'*{ext}')))
+    @Slot(str, object, object)
+    def scan(self, tag, file_paths=None, skip_paths=None):
+        """Scan ``file_paths``, or the whole music_dir when it is None.
+
+        Files in ``skip_paths`` are left out without reading their tags.
+        """
+        if file_paths is not None:
+            all_files = list(file_paths)
+        else:
+            all_files = []
+            for file_path in self.iter_audio_files(self.music_dir):
+                if self._abort:
+                    return
+                all_files.append(file_path)
+        if skip_paths:
+            all_files = [path for path in all_files if path not in skip_paths]
 
         self.scan_progress.emit(0, len(all_files))
 
         music_data = []
         for i, file_path in enumerate(all_files):
+            if self._abort:
+                return
             try:
-                music_data.append(self.extract_track_info(file_path))
+                music_data.append(self._cached_track_info(file_path))
             except Exception as e:
                 print(f"Error reading {file_path}: {e}")
             self.scan_progress.emit(i + 1, len(all_files))
 
-        self.scan_complete.emit(music_data)
+        self.scan_complete.emit(tag, music_data)
+
+    @staticmethod
+    def iter_audio_files(root):
+        """Yield paths (as str) of audio files under ``root`` in a single directory walk."""
+        stack = [root]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        # Only the suffix is lowercased, not every file name in the tree
+                        name = entry.name
+                        if name[name.rfind('.'):].lower() in _AUDIO_EXTENSION_SET:
+                            yield entry.path
+            except OSError as e:
+                print(f"Error scanning {folder}: {e}")
+
+    def _cached_track_info(self, file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return self.extract_track_info(file_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._track_cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            cover_path = cached[1]['cover_path']
+            if cover_path is None or os.path.exists(cover_path):
+                # A rescan yields fresh rows, same as re-reading the tags would
+                track = dict(cached[1])
+                track['date_added'] = datetime.now().isoformat()
+                return track
+        track = self.extract_track_info(file_path)
+        # Snapshot: the library updates play counts on the dicts it receives
+        self._track_cache[file_path] = (key, dict(track))
+        return track
 
     def extract_track_info(self, file_path):
         from mutagen import File as MutagenFile
 
-        file_path = Path(file_path)
+        # Plain string handling: the scanner walks with os.scandir and already yields str paths
+        file_path = os.fspath(file_path)
+        file_name = os.path.basename(file_path)
+        stem, ext = os.path.splitext(file_name)
         track = {
-            'id': hashlib.md5(str(file_path).encode()).hexdigest(),
-            'file_path': str(file_path),
-            'file_name': file_path.name,
-            'title': file_path.stem,
+            'id': hashlib.md5(file_path.encode()).hexdigest(),
+            'file_path': file_path,
+            'file_name': file_name,
+            'title': stem,
             'artist': 'Unknown Artist',
             'album': 'Unknown Album',
             'duration': 0,
@@ -306,6 +529,9 @@ class MusicScanner(QThread):
             'last_played': None
         }
 
+        if ext.lower() == '.mp3' and self._extract_mp3_fast(file_path, track):
+            return track
+
         try:
             audio = MutagenFile(file_path)
             if audio is not None:
@@ -325,20 +551,12 @@ class MusicScanner(QThread):
 
                     # Extract attached pictures (APIC)
                     try:
-                        for key in tags.keys():
-                            if key.startswith('APIC') or key.lower().startswith('apic'):
-                                apic = tags[key]
-                                cover_data = getattr(apic, 'data', None)
-                                mime = getattr(apic, 'mime', None)
-                                if cover_data:
-                                    cover_ext = '.jpg' if mime and 'jpeg' in mime.lower() else '.png'
-                                    cover_filename = f"{track['id']}{cover_ext}"
-                                    cover_path = Path('covers') / cover_filename
-                                    cover_path.parent.mkdir(exist_ok=True)
-                                    with open(cover_path, 'wb') as f:
-                                        f.write(cover_data)
-                                    track['cover_path'] = str(cover_path)
-                                    break
+                        apic_frames = tags.getall('APIC') if hasattr(tags, 'getall') else []
+                        for apic in apic_frames:
+                            cover_data = getattr(apic, 'data', None)
+                            if cover_data:
+                                self._save_cover(track, cover_data, getattr(apic, 'mime', None))
+                                break
                     except Exception:
                         pass
 
@@ -355,74 +573,336 @@ class MusicScanner(QThread):
 
         return track
 
+    def _extract_mp3_fast(self, file_path, track):
+        """Fill ``track`` from the ID3 tag and MPEG headers without a full mutagen parse.
+
+        Returns False when the file needs the generic mutagen path.
+        """
+        from mutagen.mp3 import MPEGInfo
+
+        try:
+            tags = read_id3_tags(file_path)
+            if tags is None:
+                return False
+            with open(file_path, 'rb') as f:
+                info = MPEGInfo(f, tags['tag_size'])
+        except Exception:
+            return False
+
+        for frame_id, field in (('TIT2', 'title'), ('TPE1', 'artist'), ('TALB', 'album'),
+                                ('TCON', 'genre'), ('TRCK', 'track_number'), ('TDRC', 'year')):
+            if frame_id in tags:
+                track[field] = tags[frame_id]
+        apic = tags.get('APIC')
+        if apic and apic['data']:
+            self._save_cover(track, apic['data'], apic['mime'])
+        track['duration'] = int(info.length * 1000)  # keep milliseconds
+        return True
+
+    def _save_cover(self, track, cover_data, mime):
+        cover_ext = '.jpg' if mime and 'jpeg' in mime.lower() else '.png'
+        os.makedirs('covers', exist_ok=True)
+        cover_path = os.path.join('covers', f"{track['id']}{cover_ext}")
+        if not self._cover_unchanged(cover_path, cover_data):
+            with open(cover_path, 'wb') as f:
+                f.write(cover_data)
+        track['cover_path'] = cover_path
+
+    @staticmethod
+    def _cover_unchanged(cover_path, cover_data):
+        # Every rescan extracts the same art again; an identical file is left alone
+        try:
+            if os.path.getsize(cover_path) != len(cover_data):
+                return False
+            with open(cover_path, 'rb') as f:
+                return f.read() == cover_data
+        except OSError:
+            return False
+
+
+class CopyTaskSignals(QObject):
+    finished = Signal(str)  # destination path
+    failed = Signal(str, str)  # source path, error message
+
+
+class CopyTask(QRunnable):
+    """Copies one file into the music folder on a QThreadPool worker."""
+
+    def __init__(self, src_path, dest_path):
+        super().__init__()
+        self.src_path = src_path
+        self.dest_path = dest_path
+        self.signals = CopyTaskSignals()
+
+    def run(self):
+        try:
+            shutil.copy2(self.src_path, self.dest_path)
+        except Exception as e:
+            self.signals.failed.emit(self.src_path, str(e))
+        else:
+            self.signals.finished.emit(self.dest_path)
+
 
 class MusicLibrary:
-    def __init__(self, db_path='music_library.json'):
+    """Music library persisted in SQLite.
+
+    ``tracks`` and ``playlists`` stay in memory for the UI, every mutation
+    is written to the database as a targeted statement instead of
+    rewriting the whole library file.
+    """
+
+    SYSTEM_PLAYLISTS = ('Favorites', 'Recently Added', 'Most Played')
+    MOST_PLAYED_LIMIT = 50
+    # PRAGMA user_version once the legacy JSON library has been considered for import
+    LEGACY_MIGRATED_VERSION = 1
+    TRACK_FIELDS = ('id', 'file_path', 'file_name', 'title', 'artist', 'album', 'duration',
+                    'track_number', 'year', 'genre', 'cover_path', 'date_added', 'play_count',
+                    'last_played')
+
+    def __init__(self, db_path='music_library.db', legacy_json_path='music_library.json'):
         self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
         self.tracks = []
         self.playlists = {}
+        self._tracks_by_id = {}
+        self._albums_cache = None
+        self._albums_by_name = None
+        # Bumped on every change to tracks or playlists (see _touch)
+        self.version = 0
+        self._playlist_tracks_cache = {}
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._create_schema()
         self.load_library()
 
+    def _create_schema(self):
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tracks (
+                id TEXT PRIMARY KEY,
+                file_path TEXT UNIQUE,
+                file_name TEXT,
+                title TEXT,
+                artist TEXT,
+                album TEXT,
+                duration INTEGER,
+                track_number,
+                year,
+                genre TEXT,
+                cover_path TEXT,
+                date_added TEXT,
+                play_count INTEGER DEFAULT 0,
+                last_played TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_album ON tracks(album);
+            CREATE TABLE IF NOT EXISTS playlists (
+                name TEXT PRIMARY KEY,
+                position INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS playlist_tracks (
+                playlist TEXT,
+                track_id TEXT,
+                position INTEGER,
+                PRIMARY KEY (playlist, position)
+            );
+        """)
+        self._conn.commit()
+
     def load_library(self):
-        if os.path.exists(self.db_path):
-            try:
-                with open(self.db_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.tracks = data.get('tracks', [])
-                    self.playlists = data.get('playlists', {})
-            except Exception as e:
-                print(f"Error loading library: {e}")
-                self.tracks = []
-                self.playlists = {}
-        else:
+        try:
+            self.tracks = [dict(row) for row in self._conn.execute("SELECT * FROM tracks ORDER BY rowid")]
+            self.playlists = {row['name']: [] for row in
+                              self._conn.execute("SELECT name FROM playlists ORDER BY position")}
+            for row in self._conn.execute(
+                    "SELECT playlist, track_id FROM playlist_tracks ORDER BY playlist, position"):
+                if row['playlist'] in self.playlists:
+                    self.playlists[row['playlist']].append(row['track_id'])
+        except Exception as e:
+            print(f"Error loading library: {e}")
             self.tracks = []
-            self.playlists = {
-                'Favorites': [],
-                'Recently Added': [],
-                'Most Played': []
-            }
+            self.playlists = {}
+
+        # The JSON library is migrated once per database; a library the user later
+        # emptied must not be refilled from the stale file on the next start
+        migrated = self._conn.execute("PRAGMA user_version").fetchone()[0] >= self.LEGACY_MIGRATED_VERSION
+        if not self.tracks and not self.playlists:
+            if not migrated and os.path.exists(self.legacy_json_path):
+                self._import_legacy_json()
+            else:
+                self.playlists = {name: [] for name in self.SYSTEM_PLAYLISTS}
+                self.save_library()
+        if not migrated:
+            self._conn.execute(f"PRAGMA user_version = {self.LEGACY_MIGRATED_VERSION}")
+            self._conn.commit()
+
+        self._tracks_by_id = {t['id']: t for t in self.tracks}
+        self._invalidate_albums()
+        self._touch()
+
+    def _invalidate_albums(self):
+        self._albums_cache = None
+        self._albums_by_name = None
+
+    def _touch(self):
+        """Позначає зміну треків або плейлистів і скидає кеш get_playlist_tracks."""
+        self.version += 1
+        self._playlist_tracks_cache = {}
+
+    def _import_legacy_json(self):
+        """Переносить бібліотеку зі старого JSON-файлу в базу даних."""
+        try:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                self.tracks = data.get('tracks', [])
+                self.playlists = data.get('playlists', {})
+        except Exception as e:
+            print(f"Error loading library: {e}")
+            self.tracks = []
+            self.playlists = {}
+        self.save_library()
+
+    def _track_row(self, track_info):
+        get = track_info.get
+        return tuple([get(field) for field in self.TRACK_FIELDS])
+
+    def _write_playlist(self, name):
+        self._conn.execute("DELETE FROM playlist_tracks WHERE playlist = ?", (name,))
+        self._conn.executemany(
+            "INSERT INTO playlist_tracks (playlist, track_id, position) VALUES (?, ?, ?)",
+            [(name, track_id, position) for position, track_id in enumerate(self.playlists[name])]
+        )
 
     def save_library(self):
-        data = {
-            'tracks': self.tracks,
-            'playlists': self.playlists
-        }
+        """Повністю синхронізує базу з ``tracks``/``playlists`` у пам'яті.
+
+        Потрібно лише після прямої зміни цих структур, звичайні методи
+        бібліотеки записують зміни точково.
+        """
+        self._tracks_by_id = {t['id']: t for t in self.tracks}
+        self._invalidate_albums()
+        self._touch()
+        placeholders = ', '.join('?' * len(self.TRACK_FIELDS))
         try:
-            with open(self.db_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self._conn:
+                self._conn.execute("DELETE FROM tracks")
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO tracks ({', '.join(self.TRACK_FIELDS)}) VALUES ({placeholders})",
+                    [self._track_row(t) for t in self.tracks]
+                )
+                self._conn.execute("DELETE FROM playlists")
+                self._conn.execute("DELETE FROM playlist_tracks")
+                self._conn.executemany(
+                    "INSERT INTO playlists (name, position) VALUES (?, ?)",
+                    [(name, position) for position, name in enumerate(self.playlists)]
+                )
+                for name in self.playlists:
+                    self._write_playlist(name)
         except Exception as e:
             print(f"Error saving library: {e}")
 
     def add_track(self, track_info):
-        existing_ids = [t['id'] for t in self.tracks]
-        if track_info['id'] not in existing_ids:
-            self.tracks.append(track_info)
-            if 'Recently Added' in self.playlists:
-                self.playlists['Recently Added'].insert(0, track_info['id'])
-                if len(self.playlists['Recently Added']) > 50:
-                    self.playlists['Recently Added'] = self.playlists['Recently Added'][:50]
-            self.save_library()
-            return True
-        return False
+        return bool(self.add_tracks([track_info]))
+
+    def add_tracks(self, tracks):
+        """Додає треки однією транзакцією, повертає список реально доданих.
+
+        Recently Added і кеш альбомів оновлюються один раз на всю пачку,
+        а не після кожного треку.
+        """
+        placeholders = ', '.join('?' * len(self.TRACK_FIELDS))
+        insert_sql = f"INSERT OR IGNORE INTO tracks ({', '.join(self.TRACK_FIELDS)}) VALUES ({placeholders})"
+        # Duplicates are filtered against the in-memory id index, which mirrors
+        # the tracks table, so the new rows can go to SQLite in one executemany
+        added = []
+        batch_ids = set()
+        for track_info in tracks:
+            track_id = track_info['id']
+            if track_id not in self._tracks_by_id and track_id not in batch_ids:
+                batch_ids.add(track_id)
+                added.append(track_info)
+        if not added:
+            return added
+        try:
+            with self._conn:
+                self._conn.executemany(insert_sql, [self._track_row(t) for t in added])
+                if 'Recently Added' in self.playlists:
+                    # Newest first, same order as adding the tracks one by one
+                    recent = [t['id'] for t in reversed(added)] + self.playlists['Recently Added']
+                    self.playlists['Recently Added'] = recent[:50]
+                    self._write_playlist('Recently Added')
+        except Exception as e:
+            print(f"Error saving library: {e}")
+            return []
+        self.tracks.extend(added)
+        self._tracks_by_id.update((t['id'], t) for t in added)
+        self._invalidate_albums()
+        self._touch()
+        return added
+
+    def replace_tracks(self, tracks):
+        """Замінює всі треки результатом повторного сканування, плейлисти зберігаються."""
+        self.clear_tracks()
+        return self.add_tracks(tracks)
+
+    def remove_track(self, track_id):
+        """Видаляє трек з бібліотеки та з усіх плейлистів."""
+        if track_id not in self._tracks_by_id:
+            return False
+        self.tracks = [t for t in self.tracks if t['id'] != track_id]
+        del self._tracks_by_id[track_id]
+        self._invalidate_albums()
+        self._touch()
+        with self._conn:
+            self._conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
+            for name, track_ids in self.playlists.items():
+                if track_id in track_ids:
+                    track_ids.remove(track_id)
+                    self._write_playlist(name)
+        return True
+
+    def clear_tracks(self):
+        """Видаляє всі треки, залишаючи плейлисти (використовується при повторному скануванні)."""
+        self.tracks.clear()
+        self._tracks_by_id.clear()
+        self._invalidate_albums()
+        self._touch()
+        with self._conn:
+            self._conn.execute("DELETE FROM tracks")
 
     def create_playlist(self, name):
         if name not in self.playlists:
             self.playlists[name] = []
-            self.save_library()
+            self._touch()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO playlists (name, position) "
+                    "VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM playlists))",
+                    (name,)
+                )
             return True
         return False
 
     def rename_playlist(self, old_name, new_name):
         if old_name in self.playlists and new_name not in self.playlists:
             self.playlists[new_name] = self.playlists.pop(old_name)
-            self.save_library()
+            self._touch()
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE playlists SET name = ?, "
+                    "position = (SELECT COALESCE(MAX(position), -1) + 1 FROM playlists) WHERE name = ?",
+                    (new_name, old_name)
+                )
+                self._conn.execute("UPDATE playlist_tracks SET playlist = ? WHERE playlist = ?",
+                                   (new_name, old_name))
             return True
         return False
 
     def delete_playlist(self, name):
-        if name in self.playlists and name not in ['Favorites', 'Recently Added', 'Most Played']:
+        if name in self.playlists and name not in self.SYSTEM_PLAYLISTS:
             del self.playlists[name]
-            self.save_library()
+            self._touch()
+            with self._conn:
+                self._conn.execute("DELETE FROM playlists WHERE name = ?", (name,))
+                self._conn.execute("DELETE FROM playlist_tracks WHERE playlist = ?", (name,))
             return True
         return False
 
@@ -430,7 +910,12 @@ class MusicLibrary:
         if playlist_name in self.playlists:
             if track_id not in self.playlists[playlist_name]:
                 self.playlists[playlist_name].append(track_id)
-                self.save_library()
+                self._touch()
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT INTO playlist_tracks (playlist, track_id, position) VALUES (?, ?, ?)",
+                        (playlist_name, track_id, len(self.playlists[playlist_name]) - 1)
+                    )
                 return True
         return False
 
@@ -438,48 +923,80 @@ class MusicLibrary:
         if playlist_name in self.playlists:
             if track_id in self.playlists[playlist_name]:
                 self.playlists[playlist_name].remove(track_id)
-                self.save_library()
+                self._touch()
+                with self._conn:
+                    self._write_playlist(playlist_name)
                 return True
         return False
 
     def increment_play_count(self, track_id):
-        for track in self.tracks:
-            if track['id'] == track_id:
-                track['play_count'] = track.get('play_count', 0) + 1
-                track['last_played'] = datetime.now().isoformat()
-
-                if 'Most Played' in self.playlists:
-                    if track_id not in self.playlists['Most Played']:
-                        self.playlists['Most Played'].append(track_id)
-                    most_played_tracks = []
-                    for t in self.tracks:
-                        if t['id'] in self.playlists['Most Played']:
-                            most_played_tracks.append((t['id'], t.get('play_count', 0)))
-                    most_played_tracks.sort(key=lambda x: x[1], reverse=True)
-                    self.playlists['Most Played'] = [track_id for track_id, _ in most_played_tracks[:50]]
-
-                self.save_library()
-                break
+        track = self._tracks_by_id.get(track_id)
+        if track is None:
+            return
+        track['play_count'] = track.get('play_count', 0) + 1
+        track['last_played'] = datetime.now().isoformat()
+
+        with self._conn:
+            self._conn.execute(
+                "UPDATE tracks SET play_count = play_count + 1, last_played = ? WHERE id = ?",
+                (track['last_played'], track_id)
+            )
+            if 'Most Played' in self.playlists and self._update_most_played(track_id):
+                self._touch()
+                self._write_playlist('Most Played')
+
+    def _update_most_played(self, track_id):
+        """Оновлює 'Most Played' лише за треком, що відтворився.
+
+        Список обмежений MOST_PLAYED_LIMIT і відсортований за play_count, тому
+        достатньо порівняти трек з найслабшим елементом замість перебору всієї
+        бібліотеки. Повертає True, якщо список змінився.
+        """
+        def count(tid):
+            return self._tracks_by_id[tid].get('play_count', 0)
+
+        previous = self.playlists['Most Played']
+        most_played = [tid for tid in previous if tid in self._tracks_by_id]
+        if track_id not in most_played:
+            if len(most_played) >= self.MOST_PLAYED_LIMIT:
+                most_played.sort(key=count, reverse=True)
+                if count(most_played[self.MOST_PLAYED_LIMIT - 1]) >= count(track_id):
+                    return False
+                most_played = most_played[:self.MOST_PLAYED_LIMIT - 1]
+            most_played.append(track_id)
+        most_played.sort(key=count, reverse=True)
+        most_played = most_played[:self.MOST_PLAYED_LIMIT]
+        if most_played == previous:
+            return False
+        self.playlists['Most Played'] = most_played
+        return True
 
     def get_track_by_id(self, track_id):
-        for track in self.tracks:
-            if track['id'] == track_id:
-                return track
-        return None
+        return self._tracks_by_id.get(track_id)
 
     def get_playlist_tracks(self, playlist_name):
+        """Треки плейлиста; список кешується до наступної зміни бібліотеки, не змінюйте його."""
+        tracks = self._playlist_tracks_cache.get(playlist_name)
+        if tracks is not None:
+            return tracks
         tracks = []
         if playlist_name in self.playlists:
             for track_id in self.playlists[playlist_name]:
                 track = self.get_track_by_id(track_id)
                 if track:
                     tracks.append(track)
+            self._playlist_tracks_cache[playlist_name] = tracks
         return tracks
 
     def get_all_tracks(self):
         return self.tracks
 
     def get_albums(self):
+        if self._albums_cache is not None:
+            return self._albums_cache
+
+        # Grouped from the in-memory tracks (what get_all_tracks returns) and sorted
+        # with str.lower, which folds Cyrillic too, unlike SQLite's LOWER()
         albums = {}
         for track in self.tracks:
             album_name = track.get('album', 'Unknown Album')
@@ -491,21 +1008,21 @@ class MusicLibrary:
                     'cover_path': track.get('cover_path')
                 }
             albums[album_name]['tracks'].append(track)
-        sorted_albums = sorted(albums.values(), key=lambda x: x['name'].lower())
-        return sorted_albums
+        self._albums_by_name = albums
+        self._albums_cache = sorted(albums.values(), key=lambda album: album['name'].lower())
+        return self._albums_cache
 
     def get_album_by_name(self, album_name):
-        albums = self.get_albums()
-        for album in albums:
-            if album['name'] == album_name:
-                return album
-        return None
+        if self._albums_by_name is None:
+            self.get_albums()
+        return self._albums_by_name.get(album_name)
 
 
 class MainWindow(QMainWindow):
     playlist_changed = Signal(str)
     library_updated = Signal()
     progress_updated = Signal(int)
+    scan_requested = Signal(str, object, object)  # request tag, file paths or None for the whole folder, paths to skip
 
     def __init__(self):
         super().__init__()
@@ -527,11 +1044,29 @@ class MainWindow(QMainWindow):
 
         self.library = MusicLibrary()
         self.current_playlist = []
+        self._current_playlist_index = {}
         self.current_track_index = -1
         self.current_playlist_name = "Recently Added"
 
         self._is_playing = False
         self._current_duration = 0
+        self._last_progress_update = 0.0
+        self._settings_theme = None  # theme the last apply_settings ran with
+        # Delivers the last position a throttled tick skipped, so the bar and labels
+        # do not stay stale when the engine stops reporting (pause, stop, end)
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(int(PROGRESS_UPDATE_INTERVAL * 1000))
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+        self._last_seek_pos = -1
+        self._last_drag_x = -1
+        self._dragging_progress = False
+        self._last_position = 0
+        self._progress_theme = None
+        # Last values shown by update_progress; text/signals are only refreshed on change
+        self._last_elapsed_sec = None
+        self._last_remaining_sec = None
+        self._last_progress_percent = None
 
         # Initialize the audio engine (VLC first, Qt fallback)
         self.audio_engine = AudioEngine(self)
@@ -550,11 +1085,52 @@ class MainWindow(QMainWindow):
         self.frames_pause_to_play = []
         self.frames_play_to_pause = []
         self._animating = False
-        self._anim_timer = None
         self._anim_index = 0
         self._anim_interval_ms = 40  # frame duration ~25 FPS
+        # One frame timer for the window's lifetime; each animation only swaps the frames
+        self._anim_frames = []
+        self._anim_on_finished = None
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(self._anim_interval_ms)
+        self._anim_timer.timeout.connect(self._on_anim_frame)
         self._queued_state = None  # 'play' or 'pause' if a click happened during animation
         self._processing_click = False  # Prevent rapid repeated clicks
+        self._static_icon = None  # 'play'/'pause' while btn_play shows a static icon, None otherwise
+
+        # library_updated is coalesced: many mutations in one event-loop turn give one refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._emit_library_updated)
+
+        # Short pause between the end of a track and what plays next; repeated
+        # end-of-media notifications restart it instead of queuing more plays
+        self._eom_timer = QTimer(self)
+        self._eom_timer.setSingleShot(True)
+        self._eom_timer.setInterval(100)
+        self._eom_timer.timeout.connect(self._do_eom_advance)
+        self._eom_loop = False
+        self._eom_was_playing = False
+
+        # Prev/next presses in quick succession only move the index; the track
+        # that is selected when they stop is the one that gets loaded
+        self._skip_timer = QTimer(self)
+        self._skip_timer.setSingleShot(True)
+        self._skip_timer.setInterval(SKIP_DEBOUNCE_MS)
+        self._skip_timer.timeout.connect(self._commit_skip)
+        self._skip_was_playing = False
+
+        # Files being copied into music_dir by CopyTask workers
+        self._pending_copies = 0
+        self._copied_paths = []
+
+        # One scanner thread for the session; scan_requested queues work onto it
+        self._scanner_thread = QThread(self)
+        self.scanner = MusicScanner(self.music_dir)
+        self.scanner.moveToThread(self._scanner_thread)
+        self.scan_requested.connect(self.scanner.scan, Qt.QueuedConnection)
+        self.scanner.scan_complete.connect(self._on_scan_result, Qt.QueuedConnection)
+        self._scanner_thread.start()
 
         self.init_ui()
         self.apply_theme()
@@ -572,58 +1148,54 @@ class MainWindow(QMainWindow):
         Якщо кадри відсутні — використовує статичні іконки.
         """
 
+        # Ensure a reasonable icon size on the button
+        self.btn_play.setIconSize(QSize(28, 28))
+        icon_size = self.btn_play.iconSize()
+
         def load_dir_frames(folder):
+            # Frames are scaled and wrapped in QIcon once here, so the animation only swaps icons
             frames = []
             if not os.path.isdir(folder):
                 return frames
             files = sorted([f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))])
             for fn in files:
-                full = os.path.join(folder, fn)
-                try:
-                    pix = QPixmap(full)
-                    if not pix.isNull():
-                        frames.append(pix)
-                except Exception:
-                    pass
+                pix = QPixmap(os.path.join(folder, fn))
+                if not pix.isNull():
+                    frames.append(QIcon(pix.scaled(icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
             return frames
 
         self.frames_pause_to_play = load_dir_frames(os.path.join('assets', 'pause-to-play'))
         self.frames_play_to_pause = load_dir_frames(os.path.join('assets', 'play-to-pause'))
 
-        # Ensure a reasonable icon size on the button
-        self.btn_play.setIconSize(QSize(28, 28))
-
         # Set initial static icon depending on current playback state
+        self._static_icon = None
         if self._is_playing:
             self._set_pause_icon_static()
         else:
             self._set_play_icon_static()
 
     def _set_play_icon_static(self):
+        # Engines report the same state repeatedly; setIcon always repaints the button
+        if self._static_icon == 'play':
+            return
+        self._static_icon = 'play'
         # prefer final frame from pause_to_play if available
         if self.frames_pause_to_play:
-            pix = self.frames_pause_to_play[-1].scaled(self.btn_play.iconSize(), Qt.KeepAspectRatio,
-                                                       Qt.SmoothTransformation)
-            self.btn_play.setIcon(QIcon(pix))
+            self.btn_play.setIcon(self.frames_pause_to_play[-1])
         else:
-            if os.path.exists('assets/play.png'):
-                self.btn_play.setIcon(QIcon('assets/play.png'))
-            else:
-                self.btn_play.setIcon(QIcon())
+            self.btn_play.setIcon(self._play_icon_fallback)
 
     def _set_pause_icon_static(self):
+        if self._static_icon == 'pause':
+            return
+        self._static_icon = 'pause'
         if self.frames_play_to_pause:
-            pix = self.frames_play_to_pause[-1].scaled(self.btn_play.iconSize(), Qt.KeepAspectRatio,
-                                                       Qt.SmoothTransformation)
-            self.btn_play.setIcon(QIcon(pix))
+            self.btn_play.setIcon(self.frames_play_to_pause[-1])
         else:
-            if os.path.exists('assets/pause.png'):
-                self.btn_play.setIcon(QIcon('assets/pause.png'))
-            else:
-                self.btn_play.setIcon(QIcon())
+            self.btn_play.setIcon(self._pause_icon_fallback)
 
     def _animate_frames(self, frames, on_finished_static, direction='forward'):
-        """Play a list of QPixmap frames on the play button at fixed interval.
+        """Play a list of pre-built QIcon frames on the play button at fixed interval.
         direction: 'forward' or 'reverse' to allow reversing a sequence when needed.
         on_finished_static: callable to apply final static icon.
         """
@@ -639,61 +1211,49 @@ class MainWindow(QMainWindow):
             return
 
         self._animating = True
-        self._anim_index = 0
+        self._static_icon = None
 
         # Prepare frame list according to direction
         frame_list = frames if direction == 'forward' else list(reversed(frames))
 
-        # Show first frame immediately for instant feedback
+        # Show first frame immediately for instant feedback; the timer continues
+        # from the second one so no tick repaints the button with the same icon
         try:
             if frame_list:
-                pix = frame_list[0].scaled(self.btn_play.iconSize(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.btn_play.setIcon(QIcon(pix))
+                self.btn_play.setIcon(frame_list[0])
         except Exception:
             pass
+        self._anim_index = 1
+        self._anim_frames = frame_list
+        self._anim_on_finished = on_finished_static
+        self._anim_timer.start()
+
+    def _on_anim_frame(self):
+        frame_list = self._anim_frames
+        if self._anim_index >= len(frame_list):
+            # stop and finalize
+            self._anim_timer.stop()
+            self._animating = False
 
-        def on_frame():
-            if self._anim_index >= len(frame_list):
-                # stop and finalize
-                if self._anim_timer:
-                    try:
-                        self._anim_timer.stop()
-                    except Exception:
-                        pass
-                    self._anim_timer = None
-
-                self._animating = False
-
-                # Apply final static icon
-                try:
-                    on_finished_static()
-                except Exception:
-                    pass
-
-                # Check for queued state
-                if self._queued_state:
-                    queued = self._queued_state
-                    self._queued_state = None
-                    QTimer.singleShot(50, lambda: self._process_queued_state(queued))
-                return
-
+            # Apply final static icon
             try:
-                if self._anim_index < len(frame_list):
-                    pix = frame_list[self._anim_index].scaled(
-                        self.btn_play.iconSize(),
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.btn_play.setIcon(QIcon(pix))
+                self._anim_on_finished()
             except Exception:
                 pass
 
-            self._anim_index += 1
+            # Check for queued state
+            if self._queued_state:
+                queued = self._queued_state
+                self._queued_state = None
+                QTimer.singleShot(50, lambda: self._process_queued_state(queued))
+            return
 
-        # Timer for frames
-        self._anim_timer = QTimer(self)
-        self._anim_timer.timeout.connect(on_frame)
-        self._anim_timer.start(self._anim_interval_ms)
+        try:
+            self.btn_play.setIcon(frame_list[self._anim_index])
+        except Exception:
+            pass
+
+        self._anim_index += 1
 
     def _process_queued_state(self, state):
         """Process queued state after current animation finishes."""
@@ -782,24 +1342,29 @@ class MainWindow(QMainWindow):
 
         left_layout.addLayout(left_title_layout)
 
-        self.playlist_scroll_area = QScrollArea()
-        self.playlist_scroll_area.setWidgetResizable(True)
-        self.playlist_scroll_area.setFrameShape(QFrame.NoFrame)
-        self.playlist_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.playlist_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        self.playlist_container = QWidget()
-        self.playlist_container.setObjectName("playlistContainer")
-        self.playlist_container.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.playlist_container.customContextMenuRequested.connect(self.show_playlist_context_menu)
-
-        self.playlist_layout = QVBoxLayout(self.playlist_container)
-        self.playlist_layout.setContentsMargins(5, 5, 5, 5)
-        self.playlist_layout.setSpacing(10)
-
-        self.playlist_scroll_area.setWidget(self.playlist_container)
-
-        left_layout.addWidget(self.playlist_scroll_area)
+        # Virtualized list: only visible playlists are painted, no widget per row
+        self.playlist_model = PlaylistListModel(self.library, self)
+        self.playlist_view = QListView()
+        self.playlist_view.setObjectName("playlistContainer")
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setItemDelegate(PlaylistItemDelegate(self.playlist_view))
+        self.playlist_view.setFrameShape(QFrame.NoFrame)
+        self.playlist_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.playlist_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.playlist_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.playlist_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.playlist_view.setUniformItemSizes(True)
+        self.playlist_view.setSpacing(5)
+        self.playlist_view.setMouseTracking(True)
+        self.playlist_view.setCursor(Qt.PointingHandCursor)
+        self.playlist_view.clicked.connect(self._on_playlist_index_clicked)
+        self.playlist_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.playlist_view.customContextMenuRequested.connect(self.show_playlist_context_menu)
+        self._last_playlist_sig = None
+        self._last_selected_name = None
+        self._playlist_menu = None
+
+        left_layout.addWidget(self.playlist_view)
 
         row.addWidget(self.left_container)
 
@@ -811,12 +1376,13 @@ class MainWindow(QMainWindow):
 
         self.pages = QStackedWidget()
         self.page_home = HomePage(self.settings, self.library, self)
-        self.page_playlist_page = Playlist(self.settings, self.library, self)
-        self.page_settings = SettingsPage(self.settings, self.apply_settings)
+        # Library and settings pages are built on first show (see show_page)
+        self.page_playlist_page = None
+        self.page_settings = None
+        # Pages whose content may be out of date; they are refreshed when shown
+        self._stale_pages = {"library", "settings"}
 
         self.pages.addWidget(self.page_home)
-        self.pages.addWidget(self.page_playlist_page)
-        self.pages.addWidget(self.page_settings)
         pages_layout.addWidget(self.pages)
         row.addWidget(self.pages_container, 1)
 
@@ -829,6 +1395,7 @@ class MainWindow(QMainWindow):
         bottom_layout.setSpacing(10)
 
         self.current_track_info = QLabel("Виберіть трек")
+        self._last_track_info_text = None
         self.current_track_info.setStyleSheet("""
             color: #ffffff;
             font-size: 14px;
@@ -856,32 +1423,71 @@ class MainWindow(QMainWindow):
 
         # Use custom painted progress bar
         self.progress_bar = RoundedProgressBar(height=14)
-        self.progress_bar.set_colors(QColor(60, 60, 60, 200),
-                                     [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)])
 
         # Override mouse events to seek audio engine directly
-        def _mouse_press(event):
-            if event.button() == Qt.LeftButton and self._current_duration > 0:
-                # Qt6: event.position() is QPointF
-                x = event.position().x()
-                w = self.progress_bar.width()
-                pct = min(1.0, max(0.0, x / w)) if w > 0 else 0.0
-                seek_pos = int(pct * self._current_duration)
+        def _seek_to_x(x, force=False):
+            self._last_drag_x = int(x)
+            w = self.progress_bar.width()
+            pct = min(1.0, max(0.0, x / w)) if w > 0 else 0.0
+            seek_pos = int(pct * self._current_duration)
+            # Dragging produces many near-identical positions; engine seeks are costly
+            if force or abs(seek_pos - self._last_seek_pos) >= max(250, self._current_duration // 1000):
+                self._last_seek_pos = seek_pos
+                # The position the engine reports after a seek is shown without throttling
+                self._last_progress_update = 0.0
                 try:
                     self.audio_engine.set_position(seek_pos)
                 except Exception:
                     pass
-                # Set internal progress for instant visual feedback
-                self.progress_bar.setValue(int(pct * (self.progress_bar.maximum() - self.progress_bar.minimum())))
-            QProgressBar.mousePressEvent(self.progress_bar, event)
+            # Set internal progress for instant visual feedback
+            self.progress_bar.setValue(int(pct * (self.progress_bar.maximum() - self.progress_bar.minimum())))
+
+        def _mouse_press(event):
+            if event.button() == Qt.LeftButton and self._current_duration > 0:
+                self._dragging_progress = True
+                # A new press always seeks: playback has moved on since the previous one
+                self._last_seek_pos = -1
+                # Qt6: event.position() is QPointF
+                _seek_to_x(event.position().x())
+            QWidget.mousePressEvent(self.progress_bar, event)
+
+        # Moves queued in one event-loop turn are applied once, with the latest
+        # position, after all of them have been processed
+        self._drag_seek_x = None
+        self._drag_seek_timer = QTimer(self)
+        self._drag_seek_timer.setSingleShot(True)
+        self._drag_seek_timer.setInterval(0)
+
+        def _flush_drag_seek():
+            x, self._drag_seek_x = self._drag_seek_x, None
+            if x is not None and int(x) != self._last_drag_x:
+                _seek_to_x(x)
+
+        self._drag_seek_timer.timeout.connect(_flush_drag_seek)
+
+        def _mouse_release(event):
+            if event.button() == Qt.LeftButton:
+                # The drag ends where the button was released, not at the last flushed
+                # move, and the engine must end up exactly where the bar shows
+                self._drag_seek_timer.stop()
+                self._drag_seek_x = None
+                if self._dragging_progress and self._current_duration > 0:
+                    _seek_to_x(event.position().x(), force=True)
+                self._dragging_progress = False
+            QWidget.mouseReleaseEvent(self.progress_bar, event)
 
         def _mouse_move(event):
-            if event.buttons() & Qt.LeftButton:
-                _mouse_press(event)
-            QProgressBar.mouseMoveEvent(self.progress_bar, event)
+            # High-rate mice report many moves within the same pixel; only a new
+            # column can change the progress value or the seek target
+            if event.buttons() & Qt.LeftButton and self._current_duration > 0:
+                self._drag_seek_x = event.position().x()
+                if not self._drag_seek_timer.isActive():
+                    self._drag_seek_timer.start()
+            QWidget.mouseMoveEvent(self.progress_bar, event)
 
         self.progress_bar.mousePressEvent = _mouse_press
         self.progress_bar.mouseMoveEvent = _mouse_move
+        self.progress_bar.mouseReleaseEvent = _mouse_release
         self.progress_bar.setCursor(Qt.PointingHandCursor)
         progress_layout.addWidget(self.progress_bar, 1)
 
@@ -901,20 +1507,24 @@ class MainWindow(QMainWindow):
         controls = QHBoxLayout()
         controls.setSpacing(12)
 
+        # Static icons are resolved once; the play/pause setters reuse the cached ones
+        self._play_icon_fallback = load_asset_icon('assets/play.png')
+        self._pause_icon_fallback = load_asset_icon('assets/pause.png')
+
         self.btn_prev = QPushButton()
-        self.btn_prev.setIcon(QIcon('assets/back.png'))
+        self.btn_prev.setIcon(load_asset_icon('assets/back.png'))
         self.btn_prev.setToolTip("Попередній трек")
 
         self.btn_play = QPushButton()
-        self.btn_play.setIcon(QIcon('assets/play.png'))
+        self.btn_play.setIcon(self._play_icon_fallback)
         self.btn_play.setToolTip("Відтворити/Пауза")
 
         self.btn_next = QPushButton()
-        self.btn_next.setIcon(QIcon('assets/next.png'))
+        self.btn_next.setIcon(load_asset_icon('assets/next.png'))
         self.btn_next.setToolTip("Наступний трек")
 
         self.btn_loop = QPushButton()
-        self.btn_loop.setIcon(QIcon('assets/loop.png'))
+        self.btn_loop.setIcon(load_asset_icon('assets/loop.png'))
         self.btn_loop.setToolTip("Увімкнути/вимкнути цикл")
         self.btn_loop.setCheckable(True)
         self._loop_enabled = False
@@ -922,24 +1532,8 @@ class MainWindow(QMainWindow):
         for btn in (self.btn_prev, self.btn_play, self.btn_next, self.btn_loop):
             btn.setFixedSize(44, 44)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255,255,255,10);
-                    border: 1px solid rgba(255,255,255,15);
-                    border-radius: 22px;
-                }
-                QPushButton:hover {
-                    background: rgba(255,255,255,20);
-                    border-color: rgba(255,255,255,25);
-                }
-                QPushButton:pressed {
-                    background: rgba(255,255,255,5);
-                }
-                QPushButton:checked {
-                    background: rgba(29, 185, 84, 0.6);
-                    border-color: rgba(29, 185, 84, 0.8);
-                }
-            """)
+            # Styled by the QPushButton#playerControl rules of the application stylesheet
+            btn.setObjectName("playerControl")
 
         self.btn_prev.clicked.connect(self.on_prev)
         self.btn_play.clicked.connect(self.on_play_pause)
@@ -956,16 +1550,18 @@ class MainWindow(QMainWindow):
         central_layout.addWidget(self.bottom_container)
         self.setCentralWidget(central)
 
-        self.setStyleSheet(self.build_stylesheet())
         self.update_playlist_panel()
 
         self.playlist_changed.connect(self.page_home.on_playlist_changed)
         self.library_updated.connect(self.page_home.refresh_library)
         self.library_updated.connect(self.update_playlist_panel)
+        self.library_updated.connect(lambda: self._stale_pages.add("library"))
 
         self.progress_updated.connect(self._on_progress_updated)
 
-    def build_stylesheet(self) -> str:
+    @staticmethod
+    def build_stylesheet() -> str:
+        """Application-wide QSS, applied once via QApplication.setStyleSheet."""
         return """
         QWidget {
             background: rgba(18, 18, 18, 255);
@@ -986,8 +1582,10 @@ class MainWindow(QMainWindow):
             background: rgba(24,24,26,250);
             border-radius: 16px;
         }
-        QWidget#playlistContainer {
+        QListView#playlistContainer {
             background: rgba(24, 24, 26, 180);
+            border: none;
+            outline: none;
         }
 
         QProgressBar {
@@ -1040,70 +1638,134 @@ class MainWindow(QMainWindow):
         QPushButton:hover {
             background: rgba(60, 60, 60, 0.9);
         }
+
+        QPushButton#playerControl {
+            background: rgba(255,255,255,10);
+            border: 1px solid rgba(255,255,255,15);
+            border-radius: 22px;
+        }
+        QPushButton#playerControl:hover {
+            background: rgba(255,255,255,20);
+            border-color: rgba(255,255,255,25);
+        }
+        QPushButton#playerControl:pressed {
+            background: rgba(255,255,255,5);
+        }
+        QPushButton#playerControl:checked {
+            background: rgba(29, 185, 84, 0.6);
+            border-color: rgba(29, 185, 84, 0.8);
+        }
         """
 
     def scan_music_library(self):
-        self.scanner = MusicScanner(self.music_dir)
-        self.scanner.scan_complete.connect(self.on_scan_complete)
-        self.scanner.start()
+        # Track ids are derived from the path, so files already in the database would
+        # be dropped by add_tracks anyway; a warm start reads tags of new files only
+        known_paths = frozenset(track['file_path'] for track in self.library.tracks)
+        self.scan_requested.emit("scan", None, known_paths)
+
+    def _on_scan_result(self, tag, music_data):
+        handlers = {
+            "scan": self.on_scan_complete,
+            "import": self._on_files_imported,
+            "refresh": self._on_refresh_complete,
+        }
+        handlers[tag](music_data)
 
     def on_scan_complete(self, music_data):
-        for track in music_data:
-            self.library.add_track(track)
-        self.update_playlist_panel()
-        self.library_updated.emit()
+        self.library.add_tracks(music_data)
+        self._refresh_timer.start()
 
     def add_music_files(self):
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Виберіть музичні файли",
-            "",
+            self.settings.value("last_import_dir", "", type=str),
             "Музичні файли (*.mp3 *.wav *.flac *.ogg *.m4a *.aac)"
         )
 
         if files:
-            for file_path in files:
-                try:
-                    dest_path = os.path.join(self.music_dir, os.path.basename(file_path))
-                    if os.path.exists(dest_path):
-                        name, ext = os.path.splitext(os.path.basename(file_path))
-                        counter = 1
-                        while os.path.exists(dest_path):
-                            dest_path = os.path.join(self.music_dir, f"{name}_{counter}{ext}")
-                            counter += 1
-
-                    shutil.copy2(file_path, dest_path)
+            # Next time the dialog opens where the user picked files, not in the working directory
+            self.settings.setValue("last_import_dir", os.path.dirname(files[0]))
+            # One directory snapshot instead of a stat per candidate name; names are
+            # reserved in it up front because the copies run in parallel
+            with os.scandir(self.music_dir) as entries:
+                existing = {entry.name for entry in entries}
+
+            def unique_name(basename):
+                if basename not in existing:
+                    return basename
+                name, ext = os.path.splitext(basename)
+                counter = 1
+                while f"{name}_{counter}{ext}" in existing:
+                    counter += 1
+                return f"{name}_{counter}{ext}"
 
-                    scanner = MusicScanner(self.music_dir)
-                    track_info = scanner.extract_track_info(dest_path)
-                    if self.library.add_track(track_info):
-                        print(f"Додано: {track_info['title']}")
+            for file_path in files:
+                dest_name = unique_name(os.path.basename(file_path))
+                existing.add(dest_name)
+                dest_path = os.path.join(self.music_dir, dest_name)
+
+                task = CopyTask(file_path, dest_path)
+                task.signals.finished.connect(self._on_file_copied, Qt.QueuedConnection)
+                task.signals.failed.connect(self._on_file_copy_failed, Qt.QueuedConnection)
+                self._pending_copies += 1
+                QThreadPool.globalInstance().start(task)
+
+    def _on_file_copied(self, dest_path):
+        self._copied_paths.append(dest_path)
+        self._finish_copy()
+
+    def _on_file_copy_failed(self, src_path, error):
+        self._finish_copy()
+        QMessageBox.warning(self, "Помилка", f"Не вдалося додати файл: {error}")
+
+    def _finish_copy(self):
+        self._pending_copies -= 1
+        if self._pending_copies == 0 and self._copied_paths:
+            copied, self._copied_paths = self._copied_paths, []
+            # Metadata is read on the scanner thread, not the GUI thread
+            self.scan_requested.emit("import", copied, None)
+
+    def _on_files_imported(self, music_data):
+        for track_info in self.library.add_tracks(music_data):
+            logger.debug("Додано: %s", track_info['title'])
+        self._refresh_timer.start()
+        QMessageBox.information(self, "Файли додано",
+                                f"Додано {len(music_data)} файлів у бібліотеку")
 
-                except Exception as e:
-                    QMessageBox.warning(self, "Помилка", f"Не вдалося додати файл: {e}")
+    def update_playlist_panel(self):
+        """Reload the playlist list model when the library playlists changed."""
+        # The library version changes on every track/playlist mutation
+        signature = self.library.version
+        if signature == self._last_playlist_sig:
+            return
+        self._last_playlist_sig = signature
+        # Reset and re-selection are painted together
+        self.playlist_view.setUpdatesEnabled(False)
+        try:
+            self.playlist_model.refresh()
+            # A model reset drops the view selection
+            self._last_selected_name = None
+            self.update_playlist_selection()
+        finally:
+            self.playlist_view.setUpdatesEnabled(True)
+
+    def _emit_library_updated(self):
+        self.library_updated.emit()
 
-            self.update_playlist_panel()
-            self.library_updated.emit()
-            QMessageBox.information(self, "Файли додано",
-                                    f"Додано {len(files)} файлів у бібліотеку")
+    def set_current_playlist(self, tracks):
+        """Встановлює поточний плейлист і індекс id -> позиція для швидкого пошуку"""
+        self.current_playlist = tracks
+        self._current_playlist_index = {t['id']: i for i, t in enumerate(tracks)}
 
-    def update_playlist_panel(self):
-        while self.playlist_layout.count():
-            child = self.playlist_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        playlists = self.library.playlists
-        for playlist_name, track_ids in playlists.items():
-            tracks = self.library.get_playlist_tracks(playlist_name)
-            playlist_item = PlaylistItem(playlist_name, tracks, self.library)
-            playlist_item.playlist_clicked.connect(self.on_playlist_clicked)
-            self.playlist_layout.addWidget(playlist_item)
-        self.playlist_layout.addStretch()
+    def _on_playlist_index_clicked(self, index):
+        playlist_name = index.data(Qt.DisplayRole)
+        # Copy: play_track_by_id may append to the current playlist
+        self.on_playlist_clicked(playlist_name, list(self.playlist_model.tracks(playlist_name)))
 
     def on_playlist_clicked(self, playlist_name, tracks):
         self.current_playlist_name = playlist_name
-        self.current_playlist = tracks
+        self.set_current_playlist(tracks)
         self.current_track_index = -1
         self.update_playlist_selection()
         self.playlist_changed.emit(playlist_name)
@@ -1116,42 +1778,47 @@ class MainWindow(QMainWindow):
             self.play_track(self.current_playlist[0], should_animate=not was_playing)
 
     def update_playlist_selection(self):
-        for i in range(self.playlist_layout.count()):
-            item = self.playlist_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, PlaylistItem):
-                    widget.setSelected(widget.playlist_name == self.current_playlist_name)
+        name = self.current_playlist_name
+        if name == self._last_selected_name:
+            return
+        self._last_selected_name = name
+        row = self.playlist_model.row_of(name)
+        if row < 0:
+            self.playlist_view.clearSelection()
+        else:
+            self.playlist_view.setCurrentIndex(self.playlist_model.index(row))
 
     def get_track_by_id(self, track_id):
         return self.library.get_track_by_id(track_id)
 
+    def _build_playlist_context_menu(self):
+        self._playlist_menu = QMenu(self)
+        self._playlist_menu.addAction("Додати музику").triggered.connect(self.add_music_files)
+        self._playlist_menu.addSeparator()
+        self._playlist_menu.addAction("Створити новий плейлист").triggered.connect(self.create_new_playlist)
+        self._playlist_menu_separator = self._playlist_menu.addSeparator()
+        self._rename_playlist_action = self._playlist_menu.addAction("")
+        self._rename_playlist_action.triggered.connect(self.rename_current_playlist)
+        self._delete_playlist_action = self._playlist_menu.addAction("")
+        self._delete_playlist_action.triggered.connect(self.delete_current_playlist)
+
     def show_playlist_context_menu(self, position):
-        menu = QMenu()
-        add_music_action = menu.addAction("Додати музику")
-        menu.addSeparator()
-        create_playlist_action = menu.addAction("Створити новий плейлист")
-        if self.current_playlist_name:
-            menu.addSeparator()
-            rename_action = menu.addAction(f"Перейменувати '{self.current_playlist_name}'")
-            delete_action = menu.addAction(f"Видалити '{self.current_playlist_name}'")
-        action = menu.exec_(self.playlist_scroll_area.mapToGlobal(position))
-        if action == add_music_action:
-            self.add_music_files()
-        elif action == create_playlist_action:
-            self.create_new_playlist()
-        elif self.current_playlist_name:
-            if action == rename_action:
-                self.rename_current_playlist()
-            elif action == delete_action:
-                self.delete_current_playlist()
+        # The menu is built on first use and reused; only the playlist actions change
+        if self._playlist_menu is None:
+            self._build_playlist_context_menu()
+        name = self.current_playlist_name
+        for action in (self._playlist_menu_separator, self._rename_playlist_action, self._delete_playlist_action):
+            action.setVisible(bool(name))
+        if name:
+            self._rename_playlist_action.setText(f"Перейменувати '{name}'")
+            self._delete_playlist_action.setText(f"Видалити '{name}'")
+        self._playlist_menu.exec(self.playlist_view.viewport().mapToGlobal(position))
 
     def create_new_playlist(self):
         name, ok = QInputDialog.getText(self, "Новий плейлист", "Введіть назву плейлиста:")
         if ok and name:
             if self.library.create_playlist(name):
-                self.update_playlist_panel()
-                self.library_updated.emit()
+                self._refresh_timer.start()
                 QMessageBox.information(self, "Успішно", f"Плейлист '{name}' створено")
             else:
                 QMessageBox.warning(self, "Помилка", f"Плейлист '{name}' вже існує")
@@ -1167,8 +1834,7 @@ class MainWindow(QMainWindow):
         if ok and new_name and new_name != self.current_playlist_name:
             if self.library.rename_playlist(self.current_playlist_name, new_name):
                 self.current_playlist_name = new_name
-                self.update_playlist_panel()
-                self.library_updated.emit()
+                self._refresh_timer.start()
                 QMessageBox.information(self, "Успішно", f"Плейлист перейменовано на '{new_name}'")
             else:
                 QMessageBox.warning(self, "Помилка", "Не вдалося перейменувати плейлист")
@@ -1185,9 +1851,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.library.delete_playlist(self.current_playlist_name):
                 self.current_playlist_name = ""
-                self.current_playlist = []
-                self.update_playlist_panel()
-                self.library_updated.emit()
+                self.set_current_playlist([])
+                self._refresh_timer.start()
                 QMessageBox.information(self, "Успішно", "Плейлист видалено")
             else:
                 QMessageBox.warning(self, "Помилка", "Не вдалося видалити плейлист")
@@ -1208,6 +1873,8 @@ class MainWindow(QMainWindow):
             self._progress_bar_clicked(event)
 
     def on_playback_state_changed(self, state):
+        # The first position after a state change is shown without throttling
+        self._last_progress_update = 0.0
         # Не перебивати анімацію, якщо вона йде
         if self._animating:
             return
@@ -1219,7 +1886,7 @@ class MainWindow(QMainWindow):
                 self._set_pause_icon_static()
             if self.current_playlist and self.current_track_index >= 0:
                 track = self.current_playlist[self.current_track_index]
-                self.current_track_info.setText(f"{track['title']} - {track['artist']}")
+                self._set_track_info(track)
         elif state == 'paused':
             self._is_playing = False
             if not self._animating:
@@ -1230,17 +1897,44 @@ class MainWindow(QMainWindow):
                 self._set_play_icon_static()
             self.progress_bar.setValue(0)
 
+    def _flush_progress(self):
+        self._last_progress_update = 0.0
+        self.update_progress(self._last_position)
+
     def update_progress(self, position):
+        self._last_position = position
         if self._current_duration > 0:
-            # position may be milliseconds
-            percentage = (position / self._current_duration) * 1000 if self._current_duration > 0 else 0
-            self.progress_bar.setValue(int(percentage))
-            elapsed_seconds = int(position // 1000)
-            remaining_seconds = int((self._current_duration - position) // 1000) if self._current_duration > 0 else 0
-            self.time_elapsed_label.setText(self._format_time(elapsed_seconds))
-            self.time_remaining_label.setText(f"-{self._format_time(remaining_seconds)}")
-            self.progress_updated.emit(
-                int((position / self._current_duration) * 100) if self._current_duration > 0 else 0)
+            # Nothing is visible while minimized; changeEvent catches up on restore
+            if self.isMinimized():
+                return
+            # Audio engines report position far more often than the UI can show it
+            now = time.monotonic()
+            if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
+                if not self._progress_flush_timer.isActive():
+                    self._progress_flush_timer.start()
+                return
+            self._last_progress_update = now
+            self._progress_flush_timer.stop()
+            # Both are integer milliseconds; the duration is cached by update_duration
+            percentage = position * 1000 // self._current_duration
+            # Only repaint the bar when the change is at least one pixel wide; while
+            # the user drags, the bar follows the cursor and lagging engine positions
+            # would only make it jump back and forth
+            px_step = max(1, 1000 // max(1, self.progress_bar.width()))
+            if not self._dragging_progress and abs(self.progress_bar.value() - percentage) >= px_step:
+                self.progress_bar.setValue(percentage)
+            elapsed_seconds = position // 1000
+            remaining_seconds = (self._current_duration - position) // 1000
+            if elapsed_seconds != self._last_elapsed_sec:
+                self._last_elapsed_sec = elapsed_seconds
+                self.time_elapsed_label.setText(self._format_time(elapsed_seconds))
+            if remaining_seconds != self._last_remaining_sec:
+                self._last_remaining_sec = remaining_seconds
+                self.time_remaining_label.setText(f"-{self._format_time(remaining_seconds)}")
+            percent = percentage // 10
+            if percent != self._last_progress_percent:
+                self._last_progress_percent = percent
+                self.progress_updated.emit(percent)
             if position > 0 and not self._progress_style_updated:
                 self._progress_style_updated = True
                 try:
@@ -1251,28 +1945,45 @@ class MainWindow(QMainWindow):
             self.progress_bar.setValue(0)
             self.time_elapsed_label.setText("0:00")
             self.time_remaining_label.setText("0:00")
+            self._reset_progress_cache()
+
+    def _reset_progress_cache(self):
+        self._last_elapsed_sec = None
+        self._last_remaining_sec = None
+        self._last_progress_percent = None
 
     def update_duration(self, duration):
         # duration may be milliseconds
         self._current_duration = duration
+        self._last_progress_update = 0.0
+        self._reset_progress_cache()
         if duration > 0:
             self.progress_bar.setValue(0)
             self._progress_style_updated = False
         else:
             self.progress_bar.setValue(0)
 
-    def _format_time(self, seconds):
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        if hours > 0:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _format_time(seconds):
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
 
     def _on_progress_updated(self, percentage):
         pass
 
+    def changeEvent(self, event):
+        # restoreGeometry in __init__ can change the window state before init_ui
+        # has created the progress widgets
+        if (event.type() == QEvent.WindowStateChange and not self.isMinimized()
+                and getattr(self, 'progress_bar', None) is not None):
+            self._last_progress_update = 0.0
+            self.update_progress(self._last_position)
+        super().changeEvent(event)
+
     def play_track_by_id(self, track_id, should_animate=None):
         """Відтворює трек за ID з можливістю контролю анімації
 
@@ -1285,14 +1996,13 @@ class MainWindow(QMainWindow):
         track = self.library.get_track_by_id(track_id)
         if track:
             # Шукаємо трек в поточному плейлисті
-            for i, t in enumerate(self.current_playlist):
-                if t['id'] == track_id:
-                    self.current_track_index = i
-                    break
-            else:
+            index = self._current_playlist_index.get(track_id)
+            if index is None:
                 # Якщо трек не знайдено в поточному плейлисті, додаємо його
-                self.current_track_index = len(self.current_playlist)
+                index = len(self.current_playlist)
                 self.current_playlist.append(track)
+                self._current_playlist_index[track_id] = index
+            self.current_track_index = index
 
             # Якщо should_animate не вказано, визначаємо автоматично
             if should_animate is None:
@@ -1310,15 +2020,20 @@ class MainWindow(QMainWindow):
                            Якщо True - завжди анімує
                            Якщо False - ніколи не анімує
         """
+        # Any other way of starting a track supersedes a pending prev/next
+        self._skip_timer.stop()
         self._progress_style_updated = False
+        self._last_progress_update = 0.0
+        self._last_seek_pos = -1
         self.audio_engine.set_source(track['file_path'])
-        self.progress_bar.setValue(0)
+        if self.progress_bar.value() != 0:
+            self.progress_bar.setValue(0)
 
         # Отримуємо поточний стан перед відтворенням
         current_state = self.audio_engine.get_current_engine().player.get_state() if hasattr(self.audio_engine.get_current_engine(), 'player') else None
         self.audio_engine.play()
 
-        self.current_track_info.setText(f"{track['title']} - {track['artist']}")
+        self._set_track_info(track)
 
         # Якщо should_animate не вказано, визначаємо автоматично
         if should_animate is None:
@@ -1339,23 +2054,37 @@ class MainWindow(QMainWindow):
 
         self._is_playing = True
         self.library.increment_play_count(track['id'])
-        self.library_updated.emit()
+        self._refresh_timer.start()
+
+    def _set_track_info(self, track):
+        # Replaying the same track (loop) or repeated 'playing' states keep the label as is
+        text = f"{track['title']} - {track['artist']}"
+        if text != self._last_track_info_text:
+            self._last_track_info_text = text
+            self.current_track_info.setText(text)
 
     def media_status_changed(self):
         try:
             # End of media handling
             if self._loop_enabled and self.current_playlist and self.current_track_index >= 0:
                 # Small delay before replaying
-                was_playing = self._is_playing
-                QTimer.singleShot(100, lambda: self.play_track(
-                    self.current_playlist[self.current_track_index],
-                    should_animate=not was_playing
-                ))
+                self._eom_loop = True
             elif not self._loop_enabled:
-                was_playing = self._is_playing
-                QTimer.singleShot(100, lambda: self.on_next_auto(was_playing))
-        except Exception as e:
-            print(f"Error in media_status_changed: {e}")
+                self._eom_loop = False
+            else:
+                return
+            self._eom_was_playing = self._is_playing
+            self._eom_timer.start()
+        except Exception:
+            logger.exception("Error in media_status_changed")
+
+    def _do_eom_advance(self):
+        if self._eom_loop:
+            if self.current_playlist and self.current_track_index >= 0:
+                self.play_track(self.current_playlist[self.current_track_index],
+                                should_animate=not self._eom_was_playing)
+        else:
+            self.on_next_auto(self._eom_was_playing)
 
     def on_next_auto(self, was_playing):
         """Автоматичний перехід на наступний трек (викликається після закінчення треку)"""
@@ -1373,16 +2102,11 @@ class MainWindow(QMainWindow):
     def refresh_library_and_playlists(self):
         self.btn_refresh.setEnabled(False)
         self.btn_refresh.setText("Оновлення...")
-        scanner = MusicScanner(self.music_dir)
-        scanner.scan_complete.connect(self._on_refresh_complete)
-        scanner.start()
+        self.scan_requested.emit("refresh", None, None)
 
     def _on_refresh_complete(self, music_data):
-        self.library.tracks.clear()
-        for track in music_data:
-            self.library.add_track(track)
-        self.update_playlist_panel()
-        self.library_updated.emit()
+        self.library.replace_tracks(music_data)
+        self._refresh_timer.start()
         self.btn_refresh.setEnabled(True)
         self.btn_refresh.setText("🔄 Оновити")
         QMessageBox.information(self, "Оновлено", "Музичну бібліотеку та плейлисти оновлено!")
@@ -1394,6 +2118,10 @@ class MainWindow(QMainWindow):
             self._queued_state = desired_state
             return
 
+        # A pending prev/next is settled by this press: pausing keeps the new track
+        # selected without starting it, playing starts it right away below
+        self._skip_timer.stop()
+
         if self._is_playing:
             self.audio_engine.pause()
             # animate pause -> play
@@ -1409,26 +2137,30 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "Плейлист пустий", "У вибраному плейлисті немає треків.")
 
     def on_prev(self):
-        if self._animating:
-            return
-
-        if self.current_playlist:
-            # Визначаємо, чи грає плеєр зараз
-            was_playing = self._is_playing
-            self.current_track_index = (self.current_track_index - 1) % len(self.current_playlist)
-            # Якщо трек вже грає, не анімуємо зміну іконки
-            self.play_track(self.current_playlist[self.current_track_index], should_animate=not was_playing)
+        self._skip(-1)
 
     def on_next(self):
+        self._skip(1)
+
+    def _skip(self, step):
         if self._animating:
             return
 
         if self.current_playlist:
-            # Визначаємо, чи грає плеєр зараз
-            was_playing = self._is_playing
-            self.current_track_index = (self.current_track_index + 1) % len(self.current_playlist)
+            if not self._skip_timer.isActive():
+                # Визначаємо, чи грав плеєр до першого натискання серії
+                self._skip_was_playing = self._is_playing
+            self.current_track_index = (self.current_track_index + step) % len(self.current_playlist)
+            # Назва оновлюється одразу, а set_source, лічильник відтворень і оновлення
+            # бібліотеки — лише для треку, на якому натискання зупинились
+            self._set_track_info(self.current_playlist[self.current_track_index])
+            self._skip_timer.start()
+
+    def _commit_skip(self):
+        if 0 <= self.current_track_index < len(self.current_playlist):
             # Якщо трек вже грає, не анімуємо зміну іконки
-            self.play_track(self.current_playlist[self.current_track_index], should_animate=not was_playing)
+            self.play_track(self.current_playlist[self.current_track_index],
+                            should_animate=not self._skip_was_playing)
 
     def on_track_double_clicked(self, track_id):
         """Викликається при подвійному кліку на трек у списку"""
@@ -1437,62 +2169,14 @@ class MainWindow(QMainWindow):
         self.play_track_by_id(track_id, should_animate=not was_playing)
 
     def update_progress_bar_theme(self, theme="default"):
+        if theme == self._progress_theme:
+            return
+        self._progress_theme = theme
         if isinstance(self.progress_bar, RoundedProgressBar):
-            if theme == "dark":
-                self.progress_bar.set_colors(QColor(60, 60, 60, 200),
-                                             [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)])
-            elif theme == "light":
-                self.progress_bar.set_colors(QColor(200, 200, 200, 200),
-                                             [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)])
-            else:
-                self.progress_bar.set_colors(QColor(60, 60, 60, 200),
-                                             [QColor(29, 185, 84), QColor(35, 200, 95), QColor(29, 185, 84)])
+            bg_color, grad_colors = PROGRESS_BAR_COLORS.get(theme, PROGRESS_BAR_COLORS["default"])
+            self.progress_bar.set_colors(bg_color, grad_colors)
         else:
-            if theme == "dark":
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        background: rgba(50, 50, 50, 200);
-                        border-radius: 7px;
-                        border: none;
-                    }
-                    QProgressBar::chunk {
-                        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,
-                            stop:0 rgba(29, 185, 84, 1), 
-                            stop:0.5 rgba(35, 200, 95, 1),
-                            stop:1 rgba(29, 185, 84, 1));
-                        border-radius: 7px;
-                    }
-                """)
-            elif theme == "light":
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        background: rgba(200, 200, 200, 200);
-                        border-radius: 7px;
-                        border: none;
-                    }
-                    QProgressBar::chunk {
-                        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,
-                            stop:0 rgba(29, 185, 84, 1), 
-                            stop:0.5 rgba(35, 200, 95, 1),
-                            stop:1 rgba(29, 185, 84, 1));
-                        border-radius: 7px;
-                    }
-                """)
-            else:
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        background: rgba(60, 60, 60, 200);
-                        border-radius: 7px;
-                        border: none;
-                    }
-                    QProgressBar::chunk {
-                        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,
-                            stop:0 rgba(29, 185, 84, 1), 
-                            stop:0.5 rgba(35, 200, 95, 1),
-                            stop:1 rgba(29, 185, 84, 1));
-                        border-radius: 7px;
-                    }
-                """)
+            self.progress_bar.setStyleSheet(PROGRESS_BAR_STYLESHEETS.get(theme, PROGRESS_BAR_STYLESHEETS["default"]))
 
     def apply_theme(self):
         theme = self.settings.value("theme", "dark", type=str)
@@ -1511,33 +2195,57 @@ class MainWindow(QMainWindow):
         if page == "home":
             self.pages.setCurrentWidget(self.page_home)
         elif page == "library":
+            if self.page_playlist_page is None:
+                self.page_playlist_page = Playlist(self.settings, self.library, self)
+                self.pages.addWidget(self.page_playlist_page)
+                self.page_playlist_page.apply_settings(self.settings)
+                # A new page has just loaded the playlists itself
+                self._stale_pages.discard("library")
             self.pages.setCurrentWidget(self.page_playlist_page)
-            try:
-                self.page_playlist_page.refresh_playlists()
-            except Exception:
-                pass
+            if "library" in self._stale_pages:
+                self._stale_pages.discard("library")
+                try:
+                    self.page_playlist_page.refresh_playlists()
+                except Exception:
+                    pass
         elif page == "settings":
+            if self.page_settings is None:
+                self.page_settings = SettingsPage(self.settings, self.apply_settings)
+                self.pages.addWidget(self.page_settings)
             self.pages.setCurrentWidget(self.page_settings)
-            try:
-                self.page_settings.apply_settings(self.settings)
-            except Exception:
-                pass
+            if "settings" in self._stale_pages:
+                self._stale_pages.discard("settings")
+                try:
+                    self.page_settings.apply_settings(self.settings)
+                except Exception:
+                    pass
 
     def apply_settings(self):
+        # A theme switch restyles both pages; they repaint once, after both are done.
+        # Other settings (the volume slider calls this on every step) change nothing
+        # visible, and re-enabling updates would repaint the whole window
+        theme = self.settings.value("theme", "dark", type=str)
+        theme_changed = theme != self._settings_theme
+        self._settings_theme = theme
+        if theme_changed:
+            self.setUpdatesEnabled(False)
         try:
-            self.page_home.apply_settings(self.settings)
-        except Exception:
-            pass
-        try:
-            self.page_playlist_page.apply_settings(self.settings)
-        except Exception:
-            pass
+            try:
+                self.page_home.apply_settings(self.settings)
+            except Exception:
+                pass
+            if self.page_playlist_page is not None:
+                try:
+                    self.page_playlist_page.apply_settings(self.settings)
+                except Exception:
+                    pass
+        finally:
+            if theme_changed:
+                self.setUpdatesEnabled(True)
 
     def closeEvent(self, event):
         # Stop all animations
-        if self._anim_timer:
-            self._anim_timer.stop()
-            self._anim_timer = None
+        self._anim_timer.stop()
 
         try:
             self.settings.setValue("window_geometry", self.saveGeometry())
@@ -1554,12 +2262,20 @@ class MainWindow(QMainWindow):
         if self._is_playing:
             self.audio_engine.stop()
 
+        # A running scan stops at the next file, queued ones are dropped with the event loop
+        self.scanner._abort = True
+        self._scanner_thread.quit()
+        self._scanner_thread.wait()
+
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    QPixmapCache.setCacheLimit(COVER_CACHE_LIMIT_KB)
+    app.setStyleSheet(MainWindow.build_stylesheet())
     if os.path.exists("app_icon.png"):
         app.setWindowIcon(QIcon("app_icon.png"))
 